@@ -8,8 +8,17 @@ It provides the methods for recording and retrieving player legacy.
 import logging
 import json
 import os
+import threading
 from datetime import datetime
+from typing import Optional
 from .resource_manager import ResourceManager
+from .utils import write_save_file_atomic
+
+# Changes are appended to a journal next to achievements.json and written in batches
+# from a timer thread; once the journal grows past the threshold it is folded back
+# into a fresh snapshot.
+JOURNAL_FLUSH_DELAY = 2.0
+JOURNAL_COMPACT_THRESHOLD = 200
 
 class AchievementsSystem:
     def __init__(self, resource_manager: ResourceManager, notify_callback=None):
@@ -20,11 +29,30 @@ class AchievementsSystem:
         # File paths for persistence
         self.save_dir = "saves"
         self.achievements_file = os.path.join(self.save_dir, "achievements.json")
+        self.journal_file = os.path.join(self.save_dir, "achievements.journal")
         
         # Initialize collections
         self.achievements = {}
         self.evidence_collection = {}
         self.unlocked_stories = set()
+
+        # --- Story index ---
+        # evidence id -> stories it belongs to, and per story how many pieces are still
+        # missing. Built lazily from evidence_by_source; dropped whenever evidence_collection
+        # is replaced wholesale (see _invalidate_story_index).
+        self._stories_by_evidence = None
+        self._story_evidence = {}
+        self._story_remaining = {}
+
+        # --- Journal state ---
+        # _pending_records and _flush_timer are shared with the timer thread (guarded by
+        # _journal_lock); _persisted and _journal_length belong to whoever holds _io_lock.
+        self._journal_lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._pending_records = []
+        self._flush_timer = None
+        self._persisted = self._snapshot_state()
+        self._journal_length = 0
         
         # Ensure save directory exists
         os.makedirs(self.save_dir, exist_ok=True)
@@ -63,6 +91,11 @@ class AchievementsSystem:
                         }
                 
                 self.logger.info("No save file found. Starting with fresh achievements.")
+
+            # Changes recorded since the snapshot was last compacted
+            replayed = self._replay_journal()
+            if replayed:
+                self.logger.info(f"Replayed {replayed} journaled achievement changes.")
                 
         except Exception as e:
             self.logger.error(f"Error loading achievements: {e}", exc_info=True)
@@ -70,19 +103,110 @@ class AchievementsSystem:
             self.evidence_collection = {}
             self.unlocked_stories = set()
 
+        self._invalidate_story_index()
+        with self._io_lock:
+            self._persisted = self._snapshot_state()
+
+    def _snapshot_state(self) -> dict:
+        return {
+            'achievements': dict(self.achievements),
+            'evidence_collection': dict(self.evidence_collection),
+            'unlocked_stories': set(self.unlocked_stories),
+        }
+
+    @staticmethod
+    def _apply_record(state: dict, record: dict):
+        op = record.get('op')
+        if op == 'achievement':
+            state['achievements'][record['id']] = record['data']
+        elif op == 'evidence':
+            state['evidence_collection'][record['id']] = record['data']
+        elif op == 'story':
+            state['unlocked_stories'].add(record['id'])
+
+    def _replay_journal(self) -> int:
+        """Applies journal records on top of the loaded snapshot. A torn final line (crash mid-append) is ignored."""
+        if not os.path.exists(self.journal_file):
+            self._journal_length = 0
+            return 0
+        state = {
+            'achievements': self.achievements,
+            'evidence_collection': self.evidence_collection,
+            'unlocked_stories': self.unlocked_stories,
+        }
+        count = 0
+        with open(self.journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    self._apply_record(state, json.loads(line))
+                    count += 1
+                except (ValueError, KeyError, TypeError) as e:
+                    self.logger.warning(f"_replay_journal: Skipping unreadable journal line: {e}")
+        self._journal_length = count
+        return count
+
+    def _journal(self, op: str, record_id: str, data: dict = None):
+        """Queues one change for the journal; the timer thread writes it out in a batch."""
+        record = {'op': op, 'id': record_id}
+        if data is not None:
+            record['data'] = dict(data)
+        with self._journal_lock:
+            self._pending_records.append(record)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(JOURNAL_FLUSH_DELAY, self._flush_journal)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush_journal(self, compact: bool = False):
+        """Appends queued records to the journal, compacting into a new snapshot when it has grown too long."""
+        with self._journal_lock:
+            records, self._pending_records = self._pending_records, []
+            self._flush_timer = None
+        with self._io_lock:
+            try:
+                if records:
+                    for record in records:
+                        self._apply_record(self._persisted, record)
+                    with open(self.journal_file, 'a', encoding='utf-8') as f:
+                        f.write(''.join(json.dumps(r, ensure_ascii=False, separators=(',', ':')) + '\n' for r in records))
+                        f.flush()
+                        os.fsync(f.fileno())
+                    self._journal_length += len(records)
+                    self.logger.debug(f"_flush_journal: Appended {len(records)} records ({self._journal_length} in journal).")
+                if self._journal_length and (compact or self._journal_length >= JOURNAL_COMPACT_THRESHOLD):
+                    self._compact_journal()
+            except Exception as e:
+                self.logger.error(f"_flush_journal: Error writing achievements journal: {e}", exc_info=True)
+
+    def _compact_journal(self):
+        """Writes the persisted state as a fresh snapshot, then drops the journal. Caller holds _io_lock."""
+        data = {
+            'achievements': self._persisted['achievements'],
+            'evidence_collection': self._persisted['evidence_collection'],
+            'unlocked_stories': sorted(self._persisted['unlocked_stories']),
+            'last_updated': datetime.now().isoformat()
+        }
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        write_save_file_atomic(self.achievements_file, payload)
+        # The snapshot now includes everything; a crash before this removal only means a harmless replay.
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+        self._journal_length = 0
+        self.logger.info("_compact_journal: Achievements snapshot rewritten and journal cleared.")
+
     def save_achievements(self):
-        """Save achievements and evidence to persistent storage."""
+        """
+        Flush every pending change to disk right now and compact the journal into the
+        snapshot. Called from the App's on_stop; during play changes go through _journal.
+        """
         try:
-            data = {
-                'achievements': self.achievements,
-                'evidence_collection': self.evidence_collection,
-                'unlocked_stories': list(self.unlocked_stories),  # Convert set to list for JSON
-                'last_updated': datetime.now().isoformat()
-            }
-            
-            with open(self.achievements_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                
+            with self._journal_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+            self._flush_journal(compact=True)
             self.logger.info("Achievements saved successfully.")
             
         except Exception as e:
@@ -120,8 +244,8 @@ class AchievementsSystem:
                     f"{master_ach_data.get('icon', '🏆')} {master_ach_data.get('name', achievement_id)}"
                 )
             
-            # Auto-save after unlocking
-            self.save_achievements()
+            # Journal the change; it reaches disk on the next batched flush
+            self._journal('achievement', achievement_id, self.achievements[achievement_id])
             return True
             
         except Exception as e:
@@ -150,51 +274,90 @@ class AchievementsSystem:
             }
             
             self.logger.info(f"Evidence recorded: '{evidence_id}' - {name}")
+            self._journal('evidence', evidence_id, self.evidence_collection[evidence_id])
             
             # Check for story completion
-            self._check_for_story_completion(evidence_id)
+            self.check_story_completion(evidence_id)
             
             # Check for evidence-based achievements
             self._check_evidence_achievements()
             
-            # Auto-save after recording evidence
-            self.save_achievements()
-            
         except Exception as e:
             self.logger.error(f"Error recording evidence '{evidence_id}': {e}", exc_info=True)
 
-    def _check_for_story_completion(self, new_evidence_id: str):
-        """Check if collecting this evidence completes any story sets."""
+    # --- Story index ---
+
+    def _invalidate_story_index(self):
+        self._stories_by_evidence = None
+
+    def _ensure_story_index(self):
+        """Inverts evidence_by_source once: which stories each piece belongs to and what each story still lacks."""
+        if self._stories_by_evidence is not None:
+            return
+        stories_by_evidence = {}
+        self._story_evidence = {}
+        self._story_remaining = {}
+        for story_name, story_data in (self.resource_manager.get_data('evidence_by_source', {}) or {}).items():
+            required_ids = frozenset(story_data.get('evidence_list', []))
+            self._story_evidence[story_name] = required_ids
+            self._story_remaining[story_name] = sum(1 for e in required_ids if e not in self.evidence_collection)
+            for evidence_id in required_ids:
+                stories_by_evidence.setdefault(evidence_id, []).append(story_name)
+        self._stories_by_evidence = {e: tuple(stories) for e, stories in stories_by_evidence.items()}
+
+    def get_story_progress(self, evidence_id: str) -> Optional[dict]:
+        """Progress of the (first) story a piece of evidence belongs to, or None if it belongs to none."""
+        self._ensure_story_index()
+        stories = self._stories_by_evidence.get(evidence_id)
+        if not stories:
+            return None
+        story_name = stories[0]
+        total = len(self._story_evidence[story_name])
+        return {
+            'story_name': story_name,
+            'collected_count': total - self._story_remaining[story_name],
+            'total_count': total,
+            'is_complete': story_name in self.unlocked_stories
+        }
+
+    def check_story_completion(self, new_evidence_id: str) -> list:
+        """
+        Counts a newly recorded piece of evidence against the stories that need it and
+        unlocks any story it completes. Returns the names of the stories unlocked.
+        """
+        completed = []
         try:
-            evidence_by_source = self.resource_manager.get_data('evidence_by_source', {})
-            collected_ids = set(self.evidence_collection.keys())
-            
-            for story_name, story_data in evidence_by_source.items():
-                required_ids = set(story_data.get('evidence_list', []))
-                
-                # Check if this evidence belongs to this story
-                if new_evidence_id in required_ids:
-                    # Check if all required evidence is collected
-                    if required_ids.issubset(collected_ids):
-                        if story_name not in self.unlocked_stories:
-                            self.unlocked_stories.add(story_name)
-                            self.logger.info(f"Story completed: '{story_name}'")
-                            
-                            # Notify UI
-                            if self.notify_callback:
-                                self.notify_callback(
-                                    "Story Unlocked!",
-                                    f"You've collected all evidence for '{story_name}'. Read the full story in your journal."
-                                )
-                            
-                            # Unlock story-related achievements
-                            if len(self.unlocked_stories) == 1:
-                                self.unlock("lore_master")  # First story
-                            elif len(self.unlocked_stories) >= 5:
-                                self.unlock("historian")   # Multiple stories
-                                
+            if self._stories_by_evidence is None:
+                # A fresh index already counts the new piece as collected.
+                self._ensure_story_index()
+            else:
+                for story_name in self._stories_by_evidence.get(new_evidence_id, ()):
+                    self._story_remaining[story_name] -= 1
+
+            for story_name in self._stories_by_evidence.get(new_evidence_id, ()):
+                if self._story_remaining[story_name] > 0 or story_name in self.unlocked_stories:
+                    continue
+                self.unlocked_stories.add(story_name)
+                self._journal('story', story_name)
+                completed.append(story_name)
+                self.logger.info(f"Story completed: '{story_name}'")
+
+                # Notify UI
+                if self.notify_callback:
+                    self.notify_callback(
+                        "Story Unlocked!",
+                        f"You've collected all evidence for '{story_name}'. Read the full story in your journal."
+                    )
+
+                # Unlock story-related achievements
+                if len(self.unlocked_stories) == 1:
+                    self.unlock("lore_master")  # First story
+                elif len(self.unlocked_stories) >= 5:
+                    self.unlock("historian")   # Multiple stories
+
         except Exception as e:
             self.logger.error(f"Error checking story completion: {e}", exc_info=True)
+        return completed
 
     def _check_evidence_achievements(self):
         """Check for achievements based on evidence collection milestones."""
@@ -1,5 +1,10 @@
+import bisect
 import collections
-from typing import Optional
+import heapq
+import itertools
+from array import array
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Tuple
 import random
 import logging
 
@@ -7,6 +12,363 @@ from .resource_manager import ResourceManager
 from .utils import color_text  # Add this import for color_text
 
 
+# Counter-strategy queue bounds: at most this many distinct (reason, location) strategies
+# wait at once, and one that has not been re-triggered for this many turns is dropped.
+MAX_PENDING_STRATEGIES = 16
+STRATEGY_MAX_AGE_TURNS = 10
+
+class CounterStrategyQueue:
+    """
+    The Ledger of Grudges.
+    Pending counter-strategies, highest priority first (first queued among equals).
+    A strategy re-triggered for the same (reason, target_location) refreshes the one
+    already waiting instead of queueing a copy. The queue is capped, and strategies
+    not re-triggered for max_age turns quietly lapse.
+    """
+    def __init__(self, max_size: int = MAX_PENDING_STRATEGIES, max_age: int = STRATEGY_MAX_AGE_TURNS):
+        self.max_size = max_size
+        self.max_age = max_age
+        self.turn = 0
+        # key -> [strategy, heap entry]; heap entries are (-priority, seq, key) and go stale lazily
+        self._entries: Dict[Tuple[str, str], list] = {}
+        self._heap: List[tuple] = []
+        self._seq = 0
+
+    @staticmethod
+    def _key(strategy: dict) -> Tuple[str, str]:
+        return (strategy.get('reason'), strategy.get('target_location'))
+
+    def push(self, strategy: dict) -> bool:
+        """Queues or refreshes a strategy. Returns True if it was new."""
+        key = self._key(strategy)
+        strategy['queued_turn'] = self.turn
+        existing = self._entries.get(key)
+        if existing is not None:
+            old_strategy, old_entry = existing
+            strategy['times_queued'] = old_strategy.get('times_queued', 1) + 1
+            if strategy.get('priority', 0) > old_strategy.get('priority', 0):
+                # Keep its place among equals, but re-file it under the higher priority.
+                existing[1] = (-strategy['priority'], old_entry[1], key)
+                heapq.heappush(self._heap, existing[1])
+            else:
+                strategy['priority'] = old_strategy.get('priority', 0)
+            existing[0] = strategy
+            return False
+
+        self._seq += 1
+        entry = (-strategy.get('priority', 0), self._seq, key)
+        strategy['times_queued'] = 1
+        self._entries[key] = [strategy, entry]
+        heapq.heappush(self._heap, entry)
+        if len(self._entries) > self.max_size:
+            # Drop whatever would run last.
+            _, evicted = max((e[1], k) for k, e in self._entries.items())
+            del self._entries[evicted]
+        return True
+
+    def _discard_stale_top(self):
+        heap = self._heap
+        while heap:
+            current = self._entries.get(heap[0][2])
+            if current is not None and current[1] is heap[0]:
+                return
+            heapq.heappop(heap)
+
+    def peek(self) -> Optional[dict]:
+        self._discard_stale_top()
+        return self._entries[self._heap[0][2]][0] if self._heap else None
+
+    def pop(self) -> Optional[dict]:
+        self._discard_stale_top()
+        if not self._heap:
+            return None
+        key = heapq.heappop(self._heap)[2]
+        return self._entries.pop(key)[0]
+
+    def advance_turn(self) -> int:
+        """Moves the queue's clock on one turn and drops lapsed strategies. Returns how many lapsed."""
+        self.turn += 1
+        cutoff = self.turn - self.max_age
+        lapsed = [key for key, (strategy, _) in self._entries.items() if strategy['queued_turn'] < cutoff]
+        for key in lapsed:
+            del self._entries[key]
+        if len(self._heap) > 4 * max(self.max_size, len(self._entries)):
+            self._heap = [entry for strategy, entry in self._entries.values()]
+            heapq.heapify(self._heap)
+        return len(lapsed)
+
+    def clear(self):
+        self._entries.clear()
+        self._heap.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+class RoomThreatModel:
+    """
+    The Tally of Rooms.
+    Per-room threat, perceived safety and visit counts kept in flat arrays indexed
+    through a room id table. The table is rebuilt for each level (begin_level), so the
+    vectors only ever hold the rooms in play. Rooms not seen before get a slot on first use.
+    """
+    VECTORS = {'threat': 'd', 'safety': 'd', 'visits': 'q'}
+
+    def __init__(self):
+        self._slots: Dict[str, int] = {}
+        self._rooms: List[str] = []
+        self.vectors: Dict[str, array] = {name: array(code) for name, code in self.VECTORS.items()}
+        self.version = 0  # bumped on every write; keys the weighted-selection cache
+        self._selection_cache = None
+
+    def slot(self, room: str) -> int:
+        slot = self._slots.get(room)
+        if slot is None:
+            slot = self._slots[room] = len(self._rooms)
+            self._rooms.append(room)
+            for vector in self.vectors.values():
+                vector.append(0)
+        return slot
+
+    def find(self, room: str) -> Optional[int]:
+        return self._slots.get(room)
+
+    def rooms(self) -> List[str]:
+        return self._rooms
+
+    def begin_level(self, room_ids):
+        """Re-keys the vectors to a new level's rooms, keeping the scores of rooms that carry over."""
+        old_slots, old_vectors = self._slots, self.vectors
+        self._slots, self._rooms = {}, []
+        self.vectors = {name: array(code) for name, code in self.VECTORS.items()}
+        for room in room_ids:
+            slot = self.slot(room)
+            old = old_slots.get(room)
+            if old is not None:
+                for name, vector in self.vectors.items():
+                    vector[slot] = old_vectors[name][old]
+        self.touch()
+
+    def touch(self):
+        self.version += 1
+
+    def weighted_choice(self, candidates: list) -> Tuple[str, float]:
+        """
+        Picks a candidate room with probability proportional to max(threat + 2 * safety, 0.1).
+        The cumulative weights are cached until the next write, so repeated picks cost one bisect.
+        Returns (room, total weight).
+        """
+        key = (self.version, tuple(candidates))
+        cache = self._selection_cache
+        if cache is None or cache[0] != key:
+            threat, safety = self.vectors['threat'], self.vectors['safety']
+            weights = []
+            for room in candidates:
+                slot = self.slot(room)
+                weights.append(max(threat[slot] + safety[slot] * 2.0, 0.1))
+            cache = self._selection_cache = (key, list(itertools.accumulate(weights)))
+        prefix = cache[1]
+        total = prefix[-1]
+        index = bisect.bisect_left(prefix, random.uniform(0, total))
+        return candidates[min(index, len(candidates) - 1)], total
+
+# Predictive spawning: how many likely next rooms are kept ready per room, and how sure
+# the transition model must be before DeathAI places a hazard ahead of the player.
+PREDICTION_TOP_K = 3
+PREDICTIVE_SPAWN_CONFIDENCE = 0.5
+
+class RoomTransitionModel:
+    """
+    The Cartographer of Habits.
+    A sparse first-order Markov model of the player's moves: counts[from][to] for every
+    successful move seen. Each room's most likely next rooms are cached and only that
+    room's entry is recomputed when one of its moves is recorded.
+    """
+    def __init__(self, top_k: int = PREDICTION_TOP_K):
+        self.top_k = top_k
+        self.counts: Dict[str, Dict[str, int]] = {}
+        self._totals: Dict[str, int] = {}
+        self._top: Dict[str, Tuple[Tuple[str, float], ...]] = {}
+        self.last_room: Optional[str] = None
+
+    def record_move(self, to_room: str) -> bool:
+        """Counts a move from last_room to to_room. Returns False if there was no previous room."""
+        from_room = self.last_room
+        self.last_room = to_room
+        if not from_room or from_room == to_room:
+            return False
+        row = self.counts.setdefault(from_room, {})
+        row[to_room] = row.get(to_room, 0) + 1
+        self._totals[from_room] = self._totals.get(from_room, 0) + 1
+        self._top.pop(from_room, None)
+        return True
+
+    def predict(self, from_room: str, k: Optional[int] = None) -> Tuple[Tuple[str, float], ...]:
+        """The k most likely next rooms after from_room, as (room, probability), most likely first."""
+        top = self._top.get(from_room)
+        if top is None:
+            row = self.counts.get(from_room)
+            if not row:
+                return ()
+            total = self._totals[from_room]
+            best = heapq.nlargest(self.top_k, row.items(), key=lambda kv: kv[1])
+            top = self._top[from_room] = tuple((room, count / total) for room, count in best)
+        return top if k is None else top[:k]
+
+    def reset(self):
+        self.counts.clear()
+        self._totals.clear()
+        self._top.clear()
+        self.last_room = None
+
+    def load_counts(self, counts: Optional[dict]):
+        self.reset()
+        for from_room, row in (counts or {}).items():
+            self.counts[from_room] = {to_room: int(count) for to_room, count in row.items()}
+            self._totals[from_room] = sum(self.counts[from_room].values())
+
+# Behaviour memory bounds. Counters lose half their weight every
+# BEHAVIOR_HALF_LIFE_TURNS turns and track at most MAX_TRACKED_PATTERNS keys; item use keeps
+# the last ITEM_USAGE_HISTORY uses of at most MAX_TRACKED_ITEMS items.
+BEHAVIOR_HALF_LIFE_TURNS = 60
+MAX_TRACKED_PATTERNS = 48
+ITEM_USAGE_HISTORY = 8
+MAX_TRACKED_ITEMS = 32
+BEHAVIOR_MEMORY_VERSION = 1
+
+class DecayingCounter(MutableMapping):
+    """
+    A capped counter whose counts fade with time. Values are stored with the turn they
+    were last written and decayed on read, so advancing the clock costs nothing. When a
+    new key would exceed the cap, the weakest key is forgotten.
+    """
+    def __init__(self, half_life: float = BEHAVIOR_HALF_LIFE_TURNS, max_keys: int = MAX_TRACKED_PATTERNS):
+        self.decay = 0.5 ** (1.0 / half_life)
+        self.max_keys = max_keys
+        self.clock = 0
+        self._values: Dict[str, Tuple[float, int]] = {}
+
+    def advance(self, turns: int = 1):
+        self.clock += turns
+
+    def __getitem__(self, key) -> float:
+        value, stamp = self._values.get(key, (0.0, self.clock))
+        return value * self.decay ** (self.clock - stamp)
+
+    def __setitem__(self, key, value):
+        if key not in self._values and len(self._values) >= self.max_keys:
+            del self._values[min(self._values, key=self.__getitem__)]
+        self._values[key] = (float(value), self.clock)
+
+    def __delitem__(self, key):
+        del self._values[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._values))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def to_state(self) -> list:
+        return [[key, round(self[key], 4)] for key in self._values]
+
+    def load_state(self, entries):
+        self._values = {}
+        for key, value in entries or ():
+            self[key] = value
+
+class ItemUsageRecord:
+    __slots__ = ('location', 'success', 'turn')
+
+    def __init__(self, location: str, success: bool, turn: int):
+        self.location = location
+        self.success = success
+        self.turn = turn
+
+    def to_state(self) -> list:
+        return [self.location, self.success, self.turn]
+
+class ItemUsageLog:
+    """Recent uses per item: a fixed-size ring of ItemUsageRecords for each of the most recently used items."""
+    def __init__(self, per_item: int = ITEM_USAGE_HISTORY, max_items: int = MAX_TRACKED_ITEMS):
+        self.per_item = per_item
+        self.max_items = max_items
+        self._uses: Dict[str, collections.deque] = {}
+
+    def record(self, item: str, location: str, success: bool, turn: int) -> ItemUsageRecord:
+        uses = self._uses.pop(item, None)
+        if uses is None:
+            uses = collections.deque(maxlen=self.per_item)
+            if len(self._uses) >= self.max_items:
+                del self._uses[next(iter(self._uses))]  # least recently used item
+        self._uses[item] = uses
+        entry = ItemUsageRecord(location, success, turn)
+        uses.append(entry)
+        return entry
+
+    def get(self, item: str, default=()):
+        return self._uses.get(item, default)
+
+    def items(self):
+        return self._uses.items()
+
+    def __len__(self) -> int:
+        return len(self._uses)
+
+    def to_state(self) -> dict:
+        return {item: [entry.to_state() for entry in uses] for item, uses in self._uses.items()}
+
+    def load_state(self, state: dict):
+        self._uses = {}
+        for item, entries in (state or {}).items():
+            for location, success, turn in entries:
+                self.record(item, location, success, turn)
+
+class RoomScoreView(MutableMapping):
+    """
+    One RoomThreatModel vector seen as the room -> score dict the rest of DeathAI was
+    written against. Like the defaultdict it replaces, reading an unknown room gives 0
+    (and gives it a slot); get() doesn't.
+    """
+    def __init__(self, model: RoomThreatModel, vector: str):
+        self._model = model
+        self._vector = vector
+
+    def __getitem__(self, room):
+        return self._model.vectors[self._vector][self._model.slot(room)]
+
+    def __setitem__(self, room, value):
+        self._model.vectors[self._vector][self._model.slot(room)] = value
+        self._model.touch()
+
+    def __delitem__(self, room):
+        slot = self._model.find(room)
+        if slot is None:
+            raise KeyError(room)
+        self._model.vectors[self._vector][slot] = 0
+        self._model.touch()
+
+    def get(self, room, default=None):
+        slot = self._model.find(room)
+        return default if slot is None else self._model.vectors[self._vector][slot]
+
+    def __contains__(self, room) -> bool:
+        return self._model.find(room) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._model.rooms()))
+
+    def __len__(self) -> int:
+        return len(self._model.rooms())
+
+    def items(self):
+        return list(zip(self._model.rooms(), self._model.vectors[self._vector]))
+
 class DeathAI:
     """
     An intelligent antagonist system that learns player behavior and 
@@ -20,21 +382,24 @@ class DeathAI:
         self.logger = logging.getLogger("DeathAI")
         self.hazard_engine = None  # Will be set after game_logic.hazard_engine is assigned
 
-        # Enhanced threat scoring system - using defaultdict for cleaner code
-        self.location_threat_scores = collections.defaultdict(float)
+        # Enhanced threat scoring system. Per-room scores live in the array-backed threat model;
+        # the views below keep the familiar room -> score dict interface.
+        self.threat_model = RoomThreatModel()
+        self.transition_model = RoomTransitionModel()
+        self.location_threat_scores = RoomScoreView(self.threat_model, 'threat')
         self.object_threat_scores = collections.defaultdict(float)
-        self.room_safety_perception = collections.defaultdict(float)  # How "safe" player thinks each room is
+        self.room_safety_perception = RoomScoreView(self.threat_model, 'safety')  # How "safe" player thinks each room is
         
         # Enhanced behavioral pattern tracking
         self.player_behavior_patterns = {
             'preferred_escape_routes': collections.deque(maxlen=10),  # Limited memory for recent patterns
-            'hiding_spots_used': collections.defaultdict(int),
-            'item_usage_patterns': collections.defaultdict(list),
+            'hiding_spots_used': DecayingCounter(),
+            'item_usage_patterns': ItemUsageLog(),
             'qte_success_rate': 0.0,
             'qte_successes': 0,
             'qte_attempts': 0,
-            'room_visit_frequency': collections.defaultdict(int),
-            'search_patterns': collections.defaultdict(int),
+            'room_visit_frequency': RoomScoreView(self.threat_model, 'visits'),
+            'search_patterns': DecayingCounter(),
             'time_spent_per_room': collections.defaultdict(int),
             'preferred_hiding_spots': set(),
             'examination_patterns': {},
@@ -51,7 +416,7 @@ class DeathAI:
         self.last_intervention_turn = 0
         
         # Enhanced counter-strategy queue with priorities
-        self.pending_counter_strategies = []
+        self.pending_counter_strategies = CounterStrategyQueue()
         self.active_strategies = []  # Legacy compatibility
         self.strategy_effectiveness = {}
         
@@ -417,25 +782,32 @@ class DeathAI:
         """Enhanced pattern recognition with robust logging."""
         patterns = self.player_behavior_patterns
         debug_details = []
+        # One call per player turn: this is the behaviour counters' clock.
+        patterns['search_patterns'].advance()
+        patterns['hiding_spots_used'].advance()
 
         # Track movement patterns
         if action == 'move' and success:
             patterns['preferred_escape_routes'].append(location)
             patterns['room_visit_frequency'][location] += 1
+            self.transition_model.record_move(location)
             debug_details.append(f"Moved to {location}, visit count: {patterns['room_visit_frequency'][location]}")
+        else:
+            # Keep the model's idea of where the player stands current, however they got there.
+            self.transition_model.last_room = location
 
         # Track search patterns
         if action == 'search':
             key = f"{location}:{target}"
             patterns['search_patterns'][key] += 1
-            debug_details.append(f"Searched {key}, count: {patterns['search_patterns'][key]}")
+            debug_details.append(f"Searched {key}, count: {patterns['search_patterns'][key]:.2f}")
 
         # Track hiding behavior
         if action == 'search' and target and any(hiding_word in target.lower()
                                                     for hiding_word in ['closet', 'cabinet', 'under', 'behind']):
             key = f"{location}:{target}"
             patterns['hiding_spots_used'][key] += 1
-            debug_details.append(f"Hiding spot used: {key}, count: {patterns['hiding_spots_used'][key]}")
+            debug_details.append(f"Hiding spot used: {key}, count: {patterns['hiding_spots_used'][key]:.2f}")
 
         # Track QTE performance
         if action.startswith('qte_'):
@@ -450,13 +822,8 @@ class DeathAI:
 
         # Track item usage effectiveness
         if action == 'use' and target:
-            usage_entry = {
-                'location': location,
-                'success': success,
-                'turn': context.get('turn', 0)
-            }
-            patterns['item_usage_patterns'][target].append(usage_entry)
-            debug_details.append(f"Used item: {target} at {location}, success: {success}, turn: {usage_entry['turn']}")
+            usage_entry = patterns['item_usage_patterns'].record(target, location, success, context.get('turn', 0))
+            debug_details.append(f"Used item: {target} at {location}, success: {success}, turn: {usage_entry.turn}")
 
         self.logger.debug(
             f"_analyze_behavioral_patterns_enhanced: action={action}, location={location}, target={target}, "
@@ -501,9 +868,9 @@ class DeathAI:
             'strategy_type': self._determine_strategy_type(reason, location)
         }
 
-        self.pending_counter_strategies.append(strategy)
-        # Sort by priority (highest first)
-        self.pending_counter_strategies.sort(key=lambda x: x['priority'], reverse=True)
+        if not self.pending_counter_strategies.push(strategy):
+            self.logger.debug(f"_queue_escalation_response: Refreshed pending strategy: reason={reason}, location={location}")
+            return
 
         self.logger.info(
             f"_queue_escalation_response: Queued strategy: reason={reason}, location={location}, "
@@ -552,11 +919,14 @@ class DeathAI:
         Called once per game turn by the HazardEngine.
         Enhanced: Adds robust logging and debugging.
         """
+        lapsed = self.pending_counter_strategies.advance_turn()
+        if lapsed:
+            self.logger.debug(f"[DeathAI] {lapsed} counter-strategies lapsed without being re-triggered.")
         if not self.pending_counter_strategies:
             self.logger.debug("[DeathAI] No pending counter-strategies to execute.")
             return []  # No strategies to execute
 
-        strategy_to_execute = self.pending_counter_strategies.pop(0)  # Get the highest priority one
+        strategy_to_execute = self.pending_counter_strategies.pop()  # Get the highest priority one
 
         self.logger.info(
             f"[DeathAI] Executing counter-strategy: reason={strategy_to_execute.get('reason')}, "
@@ -598,7 +968,7 @@ class DeathAI:
         self.logger.info(f"DeathAI manifesting presence in {location} (player fear: {self.game_logic.player.get('fear', 0):.2f})")
 
         # Check if Death's Breath already exists in this location
-        active_ids = self.hazard_engine.get_active_hazards_for_room(location)
+        active_ids = self.hazard_engine.get_hazard_ids_in_room(location)
         deaths_breath_id = None
         for hid in active_ids:
             # Our hazard ids are like "<type>#abcd1234"
@@ -815,9 +1185,27 @@ class DeathAI:
 
         return True
     
+    def predict_next_rooms(self, from_room: Optional[str] = None, k: int = PREDICTION_TOP_K) -> Tuple[Tuple[str, float], ...]:
+        """Most likely next rooms from from_room (default: the player's room), as (room, probability)."""
+        from_room = from_room or self.game_logic.player.get('location')
+        return self.transition_model.predict(from_room, k) if from_room else ()
+
+    def _room_ahead_of_player(self, min_probability: float = PREDICTIVE_SPAWN_CONFIDENCE) -> Optional[str]:
+        """The room the player will most likely enter next, if the model is confident enough."""
+        for room, probability in self.predict_next_rooms(k=1):
+            if probability >= min_probability and room in self.game_logic.current_level_rooms_world_state:
+                return room
+        return None
+
     def _spawn_targeted_hazard(self, location: str, strategy: dict) -> bool:
         """Spawn hazard specifically targeting high-threat locations. Adds robust logging and debugging."""
         threat_score = self.location_threat_scores[location]
+        if location == self.game_logic.player.get('location'):
+            # Rather than drop it on the player's head, wait for them where they are headed.
+            ahead = self._room_ahead_of_player()
+            if ahead:
+                self.logger.debug(f"_spawn_targeted_hazard: player is in '{location}'; seeding ahead in '{ahead}'.")
+                location = ahead
         self.logger.debug(
             f"_spawn_targeted_hazard called: location={location}, threat_score={threat_score:.2f}, strategy={strategy}"
         )
@@ -1068,41 +1456,20 @@ class DeathAI:
             self.logger.warning("get_threat_weighted_location called with empty candidate_locations.")
             return None
 
-        weights = []
-        for location in candidate_locations:
-            threat_score = self.location_threat_scores[location]
-            safety_perception = self.room_safety_perception[location]
-            combined_weight = threat_score + (safety_perception * 2.0)
-            weights.append(max(combined_weight, 0.1))  # Minimum weight of 0.1
-            self.logger.debug(
-                f"Location '{location}': threat_score={threat_score:.2f}, safety_perception={safety_perception:.2f}, combined_weight={combined_weight:.2f}"
-            )
-
-        total_weight = sum(weights)
-        self.logger.debug(f"Total weight for selection: {total_weight:.2f}, weights={weights}")
-
-        if total_weight == 0:
-            selected = random.choice(candidate_locations)
-            self.logger.info(f"All weights zero, randomly selected '{selected}'")
-            return selected
-
-        rand_value = random.uniform(0, total_weight)
-        cumulative_weight = 0
-
-        for i, weight in enumerate(weights):
-            cumulative_weight += weight
-            if rand_value <= cumulative_weight:
-                selected_location = candidate_locations[i]
-                self.logger.info(
-                    f"[DeathAI] Selected {selected_location} for hazard spawn "
-                    f"(threat: {self.location_threat_scores[selected_location]:.2f}, "
-                    f"safety: {self.room_safety_perception[selected_location]:.2f})"
-                )
-                return selected_location
-
-        self.logger.warning("Weighted selection fell through; returning last candidate.")
-        return candidate_locations[-1]  # Fallback
+        selected_location, total_weight = self.threat_model.weighted_choice(candidate_locations)
+        self.logger.info(
+            f"[DeathAI] Selected {selected_location} for hazard spawn "
+            f"(threat: {self.location_threat_scores[selected_location]:.2f}, "
+            f"safety: {self.room_safety_perception[selected_location]:.2f}, total weight: {total_weight:.2f})"
+        )
+        return selected_location
     
+    def begin_level(self, room_ids):
+        """Re-keys the per-room threat model to the rooms of the level about to start."""
+        self.threat_model.begin_level(room_ids)
+        self.transition_model.reset()
+        self.logger.debug(f"begin_level: threat model now tracks {len(self.threat_model.rooms())} rooms.")
+
     def get_status_report(self) -> dict:
         """Return current AI status for debugging with robust logging."""
         self.logger.debug("get_status_report called.")
@@ -1119,7 +1486,7 @@ class DeathAI:
         report = {
             'top_threat_locations': top_threat_locations,
             'top_safe_perception_locations': top_safe_perception_locations,
-            'pending_strategies': len(self.pending_counter_strategies),
+            'pending_strategies': self.get_strategy_queue_depth(),
             'active_strategies': len(self.active_strategies),  # Legacy compatibility
             'aggression_multiplier': self.current_aggression_multiplier,
             'qte_success_rate': self.player_behavior_patterns['qte_success_rate']
@@ -1127,6 +1494,10 @@ class DeathAI:
         self.logger.debug(f"get_status_report: {report}")
         return report
 
+    def get_strategy_queue_depth(self) -> int:
+        """Diagnostics: how many distinct counter-strategies are waiting."""
+        return len(self.pending_counter_strategies)
+
     def get_threat_analysis(self):
         """Return current threat analysis for debugging/display (legacy compatibility) with robust logging."""
         self.logger.debug("get_threat_analysis called.")
@@ -1171,7 +1542,9 @@ class DeathAI:
         safe_rooms = [room for room, score in self.room_safety_perception.items() if score > 2.0]
         self.logger.debug(f"Safe rooms with high safety perception: {safe_rooms}")
         if safe_rooms:
-            chosen_room = random.choice(safe_rooms)
+            # Prefer a safe room the player is likely to walk into next.
+            predicted = [room for room, _ in self.predict_next_rooms() if room in safe_rooms]
+            chosen_room = predicted[0] if predicted else random.choice(safe_rooms)
             activation = {
                 "hazard_type": "gas_leak",
                 "location": chosen_room,
@@ -1221,17 +1594,19 @@ class DeathAI:
         Applies environmental effects like temperature, lighting, etc.
         """
         rooms_data = self.game_logic.resource_manager.get_data('rooms', {})
+        current_level = str(self.game_logic.player.get('current_level', 1))
         cold_rooms = []
         dark_rooms = []
-        for level_rooms in rooms_data.values():
-            for room_id, room_data in level_rooms.items():
-                if (room_data.get('temperature') == 'cold' or 
-                    'morgue' in room_data.get('name', '').lower() or
-                    'basement' in room_data.get('name', '').lower()):
-                    cold_rooms.append(room_id)
-                if (room_data.get('lighting') == 'dark' or
-                    'basement' in room_data.get('name', '').lower()):
-                    dark_rooms.append(room_id)
+        # Only the current level's rooms can contain the player; avoid loading every level.
+        level_rooms = rooms_data.get(current_level) or {}
+        for room_id, room_data in level_rooms.items():
+            if (room_data.get('temperature') == 'cold' or 
+                'morgue' in room_data.get('name', '').lower() or
+                'basement' in room_data.get('name', '').lower()):
+                cold_rooms.append(room_id)
+            if (room_data.get('lighting') == 'dark' or
+                'basement' in room_data.get('name', '').lower()):
+                dark_rooms.append(room_id)
         # Apply cold environment effects
         if room_name in cold_rooms and self.game_logic.player.get('temperature_status') != 'warm':
             description += " The cold air makes you shiver."
@@ -1384,7 +1759,7 @@ class DeathAI:
         if not self.pending_counter_strategies:
             self.logger.debug("No pending counter-strategies; no omen message generated.")
             return None
-        strategy = self.pending_counter_strategies[0]
+        strategy = self.pending_counter_strategies.peek()
         reason = strategy.get('reason', '')
         location = strategy.get('location', '')
         self.logger.debug(f"Pending strategy for omen: reason={reason}, location={location}")
@@ -1410,12 +1785,48 @@ class DeathAI:
     def get_save_state(self) -> dict:
         """Get the current state for saving."""
         return {
-            "aggression_level": self.aggression_level,
-            "last_intervention_time": self.last_intervention_time,
+            "aggression_level": getattr(self, 'aggression_level', 0.0),
+            "last_intervention_time": getattr(self, 'last_intervention_time', 0),
             "recent_hiding_spots": list(self.recent_hiding_spots) if hasattr(self, 'recent_hiding_spots') else [],
             "intervention_count": getattr(self, 'intervention_count', 0),
-            "fear_threshold": getattr(self, 'fear_threshold', 0.5)
+            "fear_threshold": getattr(self, 'fear_threshold', 0.5),
+            "behavior_memory": self._get_behavior_memory_state()
         }
+
+    def _get_behavior_memory_state(self) -> dict:
+        """What DeathAI has learned about the player, in a bounded, versioned form."""
+        patterns = self.player_behavior_patterns
+        return {
+            "version": BEHAVIOR_MEMORY_VERSION,
+            "escape_routes": list(patterns['preferred_escape_routes']),
+            "hiding_spots_used": patterns['hiding_spots_used'].to_state(),
+            "search_patterns": patterns['search_patterns'].to_state(),
+            "item_usage": patterns['item_usage_patterns'].to_state(),
+            "qte": [patterns['qte_successes'], patterns['qte_attempts']],
+            "indicators": [patterns['panic_indicators'], patterns['confidence_indicators']],
+            "room_visits": {room: count for room, count in patterns['room_visit_frequency'].items() if count},
+            "transitions": self.transition_model.counts,
+            "last_room": self.transition_model.last_room,
+        }
+
+    def _load_behavior_memory_state(self, memory: dict):
+        version = memory.get("version", 0)
+        if version > BEHAVIOR_MEMORY_VERSION:
+            self.logger.warning(f"_load_behavior_memory_state: behaviour memory version {version} is newer than supported; starting fresh.")
+            return
+        patterns = self.player_behavior_patterns
+        patterns['preferred_escape_routes'].clear()
+        patterns['preferred_escape_routes'].extend(memory.get("escape_routes", []))
+        patterns['hiding_spots_used'].load_state(memory.get("hiding_spots_used"))
+        patterns['search_patterns'].load_state(memory.get("search_patterns"))
+        patterns['item_usage_patterns'].load_state(memory.get("item_usage"))
+        patterns['qte_successes'], patterns['qte_attempts'] = memory.get("qte", [0, 0])
+        patterns['qte_success_rate'] = patterns['qte_successes'] / max(1, patterns['qte_attempts'])
+        patterns['panic_indicators'], patterns['confidence_indicators'] = memory.get("indicators", [0, 0])
+        for room, count in (memory.get("room_visits") or {}).items():
+            patterns['room_visit_frequency'][room] = count
+        self.transition_model.load_counts(memory.get("transitions"))
+        self.transition_model.last_room = memory.get("last_room")
     
     def load_state(self, state_data: dict):
         """Restore state from save data."""
@@ -1429,6 +1840,8 @@ class DeathAI:
                 self.intervention_count = state_data.get("intervention_count", 0)
             if hasattr(self, 'fear_threshold'):
                 self.fear_threshold = state_data.get("fear_threshold", 0.5)
+            if state_data.get("behavior_memory"):
+                self._load_behavior_memory_state(state_data["behavior_memory"])
             
             self.logger.info("Death AI state restored from save")
         except Exception as e:
@@ -11,7 +11,8 @@ import re
 import os
 import math
 import string
-from .resource_manager import ResourceManager
+import threading
+from .resource_manager import ResourceManager, LevelItemState, LevelWorldState, normalize_name
 from .hazard_engine import HazardEngine
 from .achievements import AchievementsSystem
 from .death_ai import DeathAI
@@ -39,10 +40,15 @@ class GameLogic:
         self.interaction_flags = set()
         self.player = {}
         self.current_level_rooms_world_state = {}
-        self.current_level_items_world_state = {}
+        self.current_level_items_world_state = LevelItemState()
         self.is_game_over = False
         self.game_won = False
         self.ui_events = []
+        self._ui_events_lock = threading.Lock()  # the save writer reports back from its own thread
+        # Per-room versions for the cached room views (description / visible entities)
+        self._room_versions = {}
+        self._room_view_generation = 0
+        self._room_view_cache = {}
         self.last_dialogue_context = {}  # tracks active NPC and options
         self.set_player_flag("has_initialized", True)
         # The Command Map: A clean way to route player commands to the correct methods.
@@ -107,7 +113,13 @@ class GameLogic:
         if not master_level_rooms:
             self.logger.error(f"_initialize_level_data: No room data found for level {level_id}.")
             raise ValueError(f"No room data found for level {level_id}.")
-        self.current_level_rooms_world_state = copy.deepcopy(master_level_rooms)
+        # Rooms are shared with the master data and only copied when something reaches into them.
+        self.current_level_rooms_world_state = LevelWorldState(master_level_rooms)
+        self.invalidate_room_views()
+        if self.death_ai:
+            self.death_ai.begin_level(self.current_level_rooms_world_state)
+        # Finished levels stay registered but their room data no longer has to sit in memory.
+        self.resource_manager.release_room_levels(level_id)
         
         # --- NEW: Build the coordinate map for this level ---
         entry_room = self.resource_manager.get_data('level_requirements', {}).get(str(level_id), {}).get('entry_room')
@@ -124,29 +136,54 @@ class GameLogic:
             self.hazard_engine.initialize_for_level(level_id)
 
         # Omen Library Compilation
-        self.logger.debug(f"_initialize_level_data: Compiling omens for level {level_id}")
-        self.current_level_omens = self._compile_level_omens(level_id)
+        # Compiled once per level by the ResourceManager; this is a cache hit after the first visit.
+        self.current_level_omens = self.resource_manager.get_level_omens(level_id)
 
         self.logger.info(f"_initialize_level_data: Rite of Genesis for Level {level_id} is complete.")
 
+    def _peek_room(self, room_id: str) -> Optional[dict]:
+        """Read-only room lookup that doesn't copy the room out of the master data. Never mutate the result."""
+        rooms_state = self.current_level_rooms_world_state
+        if isinstance(rooms_state, LevelWorldState):
+            return rooms_state.peek(room_id)
+        return rooms_state.get(room_id)
+
+    def _peek_room_items(self):
+        rooms_state = self.current_level_rooms_world_state
+        if isinstance(rooms_state, LevelWorldState):
+            return rooms_state.peek_items()
+        return rooms_state.items()
+
+    def _restore_level_rooms(self, level_id, saved_rooms: dict, removed: list):
+        """Lays the saved room changes back over the level's master rooms. Full (older) saves simply override every room."""
+        master_level_rooms = self.resource_manager.get_data('rooms', {}).get(str(level_id))
+        if not master_level_rooms:
+            self.logger.warning(f"_restore_level_rooms: No master rooms for level {level_id}; using saved rooms as-is.")
+            return dict(saved_rooms or {})
+        self.resource_manager.release_room_levels(level_id)
+        return LevelWorldState(master_level_rooms, overrides=saved_rooms, removed=removed)
+
     # --- NEW: Item Placement Logic ---
     def _populate_level_with_items(self, level_id: int):
-        """Places both static and randomly distributed items throughout the level. Injected with robust debugging logic."""
+        """Places both static and randomly distributed items throughout the level."""
         try:
             self.logger.debug(f"_populate_level_with_items: Populating items for level {level_id}")
-            self.current_level_items_world_state = {}
+            self.current_level_items_world_state = LevelItemState()
             items_master = self.resource_manager.get_data('items', {})
-            self.logger.debug(f"_populate_level_with_items: Loaded items_master keys: {list(items_master.keys())}")
+            # Static placements and container rooms come precomputed from the level's master data.
+            layout = self.resource_manager.get_level_item_layout(level_id)
 
             # --- Stage A: Identify all containers in the level ---
             all_containers = []
-            for room_id, room_data in self.current_level_rooms_world_state.items():
-                self.logger.debug(f"_populate_level_with_items: Checking room '{room_id}' for containers")
-                for furniture in room_data.get('furniture', []):
+            rooms_state = self.current_level_rooms_world_state
+            for room_id in layout.container_rooms:
+                if room_id not in rooms_state:
+                    continue
+                # Containers get filled below, so this room needs its own copy.
+                for furniture in rooms_state[room_id].get('furniture', []):
                     if isinstance(furniture, dict) and furniture.get('is_container'):
                         furniture.setdefault('items', [])
-                        all_containers.append({'room': room_id, 'furniture_data': furniture})
-                        self.logger.debug(f"_populate_level_with_items: Found container '{furniture.get('name')}' in room '{room_id}'")
+                        all_containers.append(furniture)
 
             # PATCH: Build set of hazard-spawned entity keys to avoid placing duplicate items
             hazard_spawned_keys = set()
@@ -159,46 +196,31 @@ class GameLogic:
                             entity_key = entity_key.get('name', '')
                         normalized = str(entity_key).strip().lower().replace(' ', '_')
                         hazard_spawned_keys.add(normalized)
-            self.logger.debug(f"_populate_level_with_items: Hazard-spawned keys to skip: {hazard_spawned_keys}")
+            if hazard_spawned_keys:
+                self.logger.debug(f"_populate_level_with_items: Hazard-spawned keys to skip: {hazard_spawned_keys}")
 
-            # --- Stage B: Compile the level's loot pool ---
+            # --- Stage B: Place static items and compile the level's loot pool ---
             random_loot_pool = []
             for item_key, item_data in items_master.items():
-                self.logger.debug(f"_populate_level_with_items: Checking item '{item_key}' for static placement")
-                is_static = False
-                for room_data in self.current_level_rooms_world_state.values():
-                    # Check both "items" and "items_present" for backward compatibility
-                    items_in_room = room_data.get('items', []) + room_data.get('items_present', [])
-                    if item_key in items_in_room:
-                        # PATCH: Skip if item matches a hazard-spawned entity
-                        if item_key in hazard_spawned_keys:
-                            self.logger.info(f"_populate_level_with_items: Skipping item '{item_key}' in '{room_data.get('name', 'UNKNOWN')}' (hazard-spawned)")
-                            continue
-                        self.logger.debug(f"_populate_level_with_items: Placing static item '{item_key}' in room '{room_data.get('name', 'UNKNOWN')}'")
-                        self.current_level_items_world_state[item_key] = {"location": room_data.get('name')}
-                        is_static = True
-                        break
-                if not is_static and item_data.get('is_distributable_in_containers'):
-                    # PATCH: Skip if item matches a hazard-spawned entity
-                    if item_key in hazard_spawned_keys:
-                        self.logger.info(f"_populate_level_with_items: Skipping random loot item '{item_key}' (hazard-spawned)")
-                        continue
+                if item_key in hazard_spawned_keys:
+                    continue
+                static_room = layout.static_items.get(item_key)
+                if static_room is not None:
+                    self.current_level_items_world_state[item_key] = {"location": static_room}
+                elif item_data.get('is_distributable_in_containers'):
                     random_loot_pool.append(item_key)
-                    self.logger.debug(f"_populate_level_with_items: Added '{item_key}' to random loot pool")
 
-            self.logger.info(f"_populate_level_with_items: Step 2: Placed static items. Step 3 will distribute {len(random_loot_pool)} random items.")
+            self.logger.info(f"_populate_level_with_items: Step 2: Placed {len(self.current_level_items_world_state)} static items. Step 3 will distribute {len(random_loot_pool)} random items.")
 
             # --- Stage C: Scatter the Threads of Chance ---
             random.shuffle(random_loot_pool)
-            self.logger.debug(f"_populate_level_with_items: Shuffled random loot pool: {random_loot_pool}")
-            for container_ref in all_containers:
-                container = container_ref['furniture_data']
-                capacity = container.get('capacity', 0)
-                self.logger.debug(f"_populate_level_with_items: Filling container '{container.get('name')}' in room '{container_ref['room']}' with capacity {capacity}")
-                while len(container['items']) < capacity and random_loot_pool:
-                    item_to_place = random_loot_pool.pop()
-                    container['items'].append(item_to_place)
-                    self.logger.debug(f"_populate_level_with_items: Placed '{item_to_place}' in '{container.get('name')}' in room '{container_ref['room']}'")
+            for container in all_containers:
+                if not random_loot_pool:
+                    break
+                free = container.get('capacity', 0) - len(container['items'])
+                if free > 0:
+                    container['items'].extend(random_loot_pool[-free:][::-1])
+                    del random_loot_pool[-free:]
         except Exception as e:
             self.logger.error(f"_populate_level_with_items: Error: {e}", exc_info=True)
 
@@ -286,62 +308,6 @@ class GameLogic:
         self.logger.debug(f"_generate_intro_disaster: Final intro disaster object: {intro_disaster_object}")
         return intro_disaster_object
 
-    def _compile_level_omens(self, level_id: int) -> dict:
-        """
-        Gathers all environmental omens from disasters, hazards, NPCs,
-        and all rooms in the current level (from their environmental_omens_config blocks),
-        and organizes them by trigger object.
-        Injected with robust debugging logic.
-        """
-        self.logger.info(f"_compile_level_omens: Compiling Omen Library for level {level_id}...")
-        omen_library = {}
-
-        # Sources to search for the 'environmental_omens' key
-        sources = [
-            ("disasters", self.resource_manager.get_data('disasters', {})),
-            ("hazards", self.resource_manager.get_data('hazards', {})),
-            ("npcs", self.resource_manager.get_data('npcs', {}))
-        ]
-
-        for source_idx, (source_name, source_collection) in enumerate(sources):
-            self.logger.debug(f"_compile_level_omens: Searching source '{source_name}' (index {source_idx}) with {len(source_collection)} items.")
-            for item_key, item_data in source_collection.items():
-                if 'environmental_omens' in item_data:
-                    self.logger.debug(f"_compile_level_omens: Found 'environmental_omens' in item '{item_key}' from source '{source_name}'.")
-                    for trigger, omen_text in item_data['environmental_omens'].items():
-                        if trigger not in omen_library:
-                            omen_library[trigger] = []
-                            self.logger.debug(f"_compile_level_omens: Created new trigger '{trigger}' from source '{source_name}'.")
-                        if isinstance(omen_text, list):
-                            self.logger.debug(f"_compile_level_omens: Adding list of omens for trigger '{trigger}' from source '{source_name}'.")
-                            omen_library[trigger].extend(omen_text)
-                        else:
-                            self.logger.debug(f"_compile_level_omens: Adding single omen for trigger '{trigger}' from source '{source_name}'.")
-                            omen_library[trigger].append(omen_text)
-                else:
-                    self.logger.debug(f"_compile_level_omens: No 'environmental_omens' in item '{item_key}' from source '{source_name}'.")
-
-        # --- NEW: Merge in omens from all rooms in the current level ---
-        all_rooms = self.resource_manager.get_data('rooms', {})
-        level_rooms = all_rooms.get(str(level_id), {})
-        for room_id, room_data in (level_rooms or {}).items():
-            env_omens_cfg = room_data.get('environmental_omens_config', {})
-            if env_omens_cfg:
-                self.logger.debug(f"_compile_level_omens: Found 'environmental_omens_config' in room '{room_id}'.")
-                for trigger, omen_text in env_omens_cfg.items():
-                    if trigger not in omen_library:
-                        omen_library[trigger] = []
-                        self.logger.debug(f"_compile_level_omens: Created new trigger '{trigger}' from room '{room_id}'.")
-                    if isinstance(omen_text, list):
-                        self.logger.debug(f"_compile_level_omens: Adding list of omens for trigger '{trigger}' from room '{room_id}'.")
-                        omen_library[trigger].extend(omen_text)
-                    else:
-                        self.logger.debug(f"_compile_level_omens: Adding single omen for trigger '{trigger}' from room '{room_id}'.")
-                        omen_library[trigger].append(omen_text)
-
-        self.logger.info(f"_compile_level_omens: Omen Library compiled with {len(omen_library)} trigger types.")
-        return omen_library
-
     # --- Game State Management ---
 
     def start_new_game(self, character_class="Journalist", start_level=1):
@@ -354,7 +320,7 @@ class GameLogic:
         self.interaction_flags = set()
         self.player = {}
         self.current_level_rooms_world_state = {}
-        self.current_level_items_world_state = {}
+        self.current_level_items_world_state = LevelItemState()
 
         # Remove any lingering game over or death flags
         # (in case previous game ended with death/game over)
@@ -480,7 +446,7 @@ class GameLogic:
 
         # --- Clear per-level collections ---
         self.current_level_rooms_world_state = {}
-        self.current_level_items_world_state = {}
+        self.current_level_items_world_state = LevelItemState()
         self.interaction_flags = set()
 
         # --- Rebuild the level world state ---
@@ -611,7 +577,7 @@ class GameLogic:
         self.interaction_flags = set()
         self.player = {}
         self.current_level_rooms_world_state = {}
-        self.current_level_items_world_state = {}
+        self.current_level_items_world_state = LevelItemState()
         self.last_dialogue_context = {}
         # Optionally reset hazard engine and death AI if needed
         if self.hazard_engine:
@@ -838,8 +804,8 @@ class GameLogic:
                             taken.append(self._get_item_display_name(key))
 
             # Take all loose items in the room
-            for key, item_state in list(self.current_level_items_world_state.items()):
-                if item_state.get('location') == current_room_id and items_master.get(key, {}).get("takeable", False):
+            for key in self.current_level_items_world_state.items_in_room(current_room_id):
+                if items_master.get(key, {}).get("takeable", False):
                     self.player['inventory'].append(key)
                     taken.append(self._get_item_display_name(key))
                     del self.current_level_items_world_state[key]
@@ -911,7 +877,7 @@ class GameLogic:
                         break
             # --- LOGIC FOR TAKING A LOOSE ITEM ---
             if not found_in_container:
-                item_location = self.current_level_items_world_state.get(item_key, {}).get('location')
+                item_location = self.current_level_items_world_state.location_of(item_key)
                 if item_location == current_room_id:
                     del self.current_level_items_world_state[item_key]
                     self.player['inventory'].append(item_key)
@@ -1028,18 +994,29 @@ class GameLogic:
         self.logger.info(f"Set adaptive qte_success_rate={val:.2f}")
         return self._build_response(message=f"qte_success_rate set to {val:.2f}", turn_taken=False)
 
-    def _command_save(self, slot_identifier: str = None) -> dict:
-        """Save the current game state to a specified slot."""
+    def _command_save(self, slot_identifier: str = None, on_complete=None) -> dict:
+        """
+        Save the current game state to a specified slot. The state is snapshotted here;
+        encoding and the disk write happen on the save writer thread, which reports back
+        through a 'show_message' UI event (and on_complete(success, error), if given).
+        """
         if not slot_identifier:
             slot_identifier = "quicksave"
         
         try:
-            from .utils import get_save_filepath
+            from .utils import get_save_filepath, get_save_writer, SAVE_FORMAT_VERSION
             from datetime import datetime
-            import json
             
+            # Only rooms that differ from the master data are written out
+            rooms_state = self.current_level_rooms_world_state
+            if isinstance(rooms_state, LevelWorldState):
+                level_rooms_delta, level_rooms_removed = rooms_state.export_delta()
+            else:
+                level_rooms_delta, level_rooms_removed = dict(rooms_state), []
+
             # Build comprehensive save data
             save_data = {
+                "save_version": SAVE_FORMAT_VERSION,
                 "save_info": {
                     "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                     "location": self.get_room_data(self.player.get('location', '')).get('name', 'Unknown'),
@@ -1051,7 +1028,8 @@ class GameLogic:
                     "score": self.player.get('score', 0)
                 },
                 "player_state": self.player.copy(),
-                "level_rooms_state": self.current_level_rooms_world_state.copy(),
+                "level_rooms_state": level_rooms_delta,
+                "level_rooms_removed": level_rooms_removed,
                 "level_items_state": self.current_level_items_world_state.copy(),
                 "interaction_flags": list(self.interaction_flags),
                 "game_flags": {
@@ -1075,19 +1053,30 @@ class GameLogic:
                 except Exception as e:
                     self.logger.warning(f"Could not save death AI state: {e}")
             
-            # Write to file
+            # Hand a private snapshot to the writer thread; play continues immediately
             save_path = get_save_filepath(slot_identifier)
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False, default=str)
-            
-            self.logger.info(f"Game saved to slot '{slot_identifier}' at {save_path}")
+            snapshot = copy.deepcopy(save_data)
+            slot_label = slot_identifier.replace('_', ' ')
+
+            def _on_written(success: bool, error: Optional[str]):
+                if success:
+                    message = color_text(f"Game saved to {slot_label}.", "success", self.resource_manager)
+                else:
+                    message = color_text(f"Failed to save game: {error}", "error", self.resource_manager)
+                self.add_ui_event({"event_type": "show_message", "message": message,
+                                   "save_slot": slot_identifier, "success": success})
+                if on_complete:
+                    on_complete(success, error)
+
+            get_save_writer().submit(save_path, snapshot, on_complete=_on_written)
+            self.logger.info(f"Game save to slot '{slot_identifier}' queued for {save_path}")
             
             # Trigger achievement for first save
             if self.achievements_system:
                 self.achievements_system.unlock("first_save")
             
             return self._build_response(
-                message=f"Game saved to {slot_identifier.replace('_', ' ')}.",
+                message=f"Saving game to {slot_label}...",
                 turn_taken=False,
                 success=True
             )
@@ -1109,10 +1098,11 @@ class GameLogic:
             )
         
         try:
-            from .utils import get_save_filepath
-            import json
+            from .utils import get_save_filepath, get_save_writer, read_save_file, SAVE_FORMAT_VERSION
             
             save_path = get_save_filepath(slot_identifier)
+            # A save to this slot may still be on its way to disk
+            get_save_writer().wait(save_path)
             
             if not os.path.exists(save_path):
                 return self._build_response(
@@ -1121,23 +1111,35 @@ class GameLogic:
                     success=False
                 )
             
-            # Load save data
-            with open(save_path, encoding='utf-8') as f:
-                save_data = json.load(f)
+            # Load save data (compressed or plain, any format version)
+            save_data = read_save_file(save_path)
             
             # Validate save data structure
-            if "player_state" not in save_data:
+            if not isinstance(save_data, dict) or "player_state" not in save_data:
                 return self._build_response(
                     message="Save file is corrupted or invalid.",
                     turn_taken=False,
                     success=False
                 )
+            save_version = save_data.get("save_version", 1)
+            if save_version > SAVE_FORMAT_VERSION:
+                return self._build_response(
+                    message="This save was made by a newer version of the game.",
+                    turn_taken=False,
+                    success=False
+                )
             
             # Restore game state
             self.player = save_data["player_state"].copy()
-            self.current_level_rooms_world_state = save_data.get("level_rooms_state", {})
-            self.current_level_items_world_state = save_data.get("level_items_state", {})
+            self.current_level_rooms_world_state = self._restore_level_rooms(
+                self.player.get('current_level', 1),
+                save_data.get("level_rooms_state", {}),
+                save_data.get("level_rooms_removed", [])
+            )
+            self.current_level_items_world_state = LevelItemState(save_data.get("level_items_state", {}))
+            self.current_level_omens = self.resource_manager.get_level_omens(self.player.get('current_level', 1))
             self.interaction_flags = set(save_data.get("interaction_flags", []))
+            self.invalidate_room_views()
             
             # Restore game flags
             game_flags = save_data.get("game_flags", {})
@@ -1193,7 +1195,7 @@ class GameLogic:
                 }]
             )
             
-        except json.JSONDecodeError:
+        except ValueError:
             self.logger.error(f"Save file '{slot_identifier}' is corrupted (invalid JSON)")
             return self._build_response(
                 message=f"Save file '{slot_identifier}' is corrupted.",
@@ -1456,6 +1458,7 @@ class GameLogic:
         """
         try:
             self.logger.info("_handle_qte_resolution: Processing QTE result")
+            self.bump_room_version(self.player.get('location'))
             self.player['qte_active'] = False
             self.add_ui_event({"event_type": "destroy_qte_popup", "priority": 1000})
 
@@ -1642,6 +1645,7 @@ class GameLogic:
                     break
 
             if updated:
+                self.bump_room_version(room_id)
                 self.logger.info(f"Unlocked furniture '{fname}' in room '{room_id}'")
                 # Nudge UI to refresh
                 self.add_ui_event({"event_type": "refresh_context_actions"})
@@ -1674,6 +1678,7 @@ class GameLogic:
                     break
 
             if updated:
+                self.bump_room_version(room_id)
                 self.logger.info(f"Broke furniture '{fname}' in room '{room_id}'")
                 self.add_ui_event({"event_type": "refresh_context_actions"})
             else:
@@ -1902,8 +1907,9 @@ class GameLogic:
             return 5
 
     def add_ui_event(self, event: dict):
-        """Adds a UI event to the queue for the GameScreen to process."""
-        self.ui_events.append(event)
+        """Adds a UI event to the queue for the GameScreen to process. Safe to call from worker threads."""
+        with self._ui_events_lock:
+            self.ui_events.append(event)
         self.logger.debug(f"UI Event Added: {event}")
 
     def get_ui_events(self) -> list:
@@ -1911,8 +1917,9 @@ class GameLogic:
         if not self.ui_events:
             return []
         # Return a copy and clear the original list
-        events_to_process = self.ui_events[:]
-        self.ui_events.clear()
+        with self._ui_events_lock:
+            events_to_process = self.ui_events[:]
+            self.ui_events.clear()
         return events_to_process
 
     def process_player_input(self, raw_input: Union[str, dict]) -> dict:
@@ -1942,6 +1949,7 @@ class GameLogic:
                 return self._build_response()  # QTE still in progress
 
         verb, target = self._parse_command(raw_input)
+        location_before = self.player.get('location')
         
         # --- NEW LOGIC: PROCESS CONSEQUENCES ---
         interaction_response = {}
@@ -1961,9 +1969,12 @@ class GameLogic:
                 response = command_method(target)
                 response = self._merge_responses(response, interaction_response)
 
-        if response.get('turn_taken', False) and not self.is_game_over:
-            end_of_turn_response = self._process_turn_end(verb, target, response.get('success', True))
-            response = self._merge_responses(response, end_of_turn_response)
+        if response.get('turn_taken', False):
+            # Anything a turn-taking command touched lives in the room(s) the player acted in
+            self.bump_room_version(location_before, self.player.get('location'))
+            if not self.is_game_over:
+                end_of_turn_response = self._process_turn_end(verb, target, response.get('success', True))
+                response = self._merge_responses(response, end_of_turn_response)
 
         # --- FINAL ASSEMBLY ---
         final_ui_events = response.get("ui_events", []) + self.get_ui_events()
@@ -2188,7 +2199,7 @@ class GameLogic:
             room_id, x, y = q.pop(0)
             self.current_level_coord_map[room_id] = (x, y)
             
-            room_data = self.get_room_data(room_id) or {}
+            room_data = self._peek_room(room_id) or {}
             exits = room_data.get('exits', {})
 
             for direction, dest_id in exits.items():
@@ -2344,14 +2355,41 @@ class GameLogic:
     def _norm(self, s: str) -> str:
         """Normalize names for matching: lowercase, strip, collapse spaces/underscores."""
         if not isinstance(s, str): return ""
-        s = s.strip().lower()
-        return re.sub(r'[\s_]+', ' ', s)
+        return normalize_name(s)
+
+    # --- Room view cache ---
+    def bump_room_version(self, *room_ids):
+        """Marks rooms as changed (items, hazards, furniture, NPC state) so their cached views are rebuilt."""
+        versions = self._room_versions
+        for room_id in room_ids:
+            if room_id:
+                versions[room_id] = versions.get(room_id, 0) + 1
+
+    def invalidate_room_views(self):
+        """Drops every cached room view, e.g. after a new level or a load replaced the world state."""
+        self._room_view_generation += 1
+        self._room_view_cache = {}
+
+    def _room_view_key(self, room_id: str) -> tuple:
+        return (self._room_view_generation, self._room_versions.get(room_id, 0))
 
     def _get_all_visible_entities_in_room(self, room_name: str) -> dict:
         """
         Gathers all visible entities: furniture, objects, loose items, and hazard-spawned entities.
-        Returns them in a structured dictionary.
+        Returns them in a structured dictionary, served from the room view cache while the room is unchanged.
         """
+        cache_key = ('entities', room_name)
+        cached = self._room_view_cache.get(cache_key)
+        if cached is None or cached[0] != self._room_view_key(room_name):
+            entities = self._build_visible_entities(room_name)
+            if not any(entities.values()) and self.get_room_data(room_name) is None:
+                return entities
+            cached = (self._room_view_key(room_name), entities)
+            self._room_view_cache[cache_key] = cached
+        # Fresh lists so callers can filter/extend without touching the cached view
+        return {kind: list(entries) for kind, entries in cached[1].items()}
+
+    def _build_visible_entities(self, room_name: str) -> dict:
         all_entities = {'furniture': [], 'objects': [], 'items': []}
         room_data = self.get_room_data(room_name)
         if not room_data:
@@ -2383,22 +2421,21 @@ class GameLogic:
 
         # Loose items in the room
         items_master = self.resource_manager.get_data('items', {})
-        for item_key, item_state in self.current_level_items_world_state.items():
-            if item_state.get('location') == room_name:
-                item_data = items_master.get(item_key, {})
-                desc = (
-                    item_data.get('description') or
-                    item_data.get('examine_details') or
-                    "An item."
-                )
-                entity = {
-                    "name": item_data.get('name', item_key),
-                    "description": desc,
-                    "type": "item",
-                    "id_key": item_key,
-                    "data": item_data
-                }
-                all_entities['items'].append(entity)
+        for item_key in self.current_level_items_world_state.items_in_room(room_name):
+            item_data = items_master.get(item_key, {})
+            desc = (
+                item_data.get('description') or
+                item_data.get('examine_details') or
+                "An item."
+            )
+            entity = {
+                "name": item_data.get('name', item_key),
+                "description": desc,
+                "type": "item",
+                "id_key": item_key,
+                "data": item_data
+            }
+            all_entities['items'].append(entity)
 
         # Hazard-spawned entities
         if self.hazard_engine:
@@ -2437,10 +2474,20 @@ class GameLogic:
         if not target_norm:
             return None
 
+        # Display-name matches come from the ResourceManager index instead of re-deriving every item's name.
+        items_master = self.resource_manager.get_data('items', {})
+        name_matches = self.resource_manager.get_item_keys_by_name(target_norm)
+
+        def item_matches(item_key: str) -> bool:
+            if item_key in name_matches:
+                return True
+            # Items without master data fall back to their key as display name.
+            return item_key not in items_master and self._norm(item_key) == target_norm
+
         # Priority 1: Player Inventory
         for item_key in self.player.get('inventory', []):
-            if self._norm(self._get_item_display_name(item_key)) == target_norm:
-                master_data = self.resource_manager.get_data('items', {}).get(item_key, {})
+            if item_matches(item_key):
+                master_data = items_master.get(item_key, {})
                 return {
                     'id_key': item_key,
                     'name': self._get_item_display_name(item_key),
@@ -2488,16 +2535,15 @@ class GameLogic:
                     }
 
         # Priority 4: Loose Items
-        for item_key, world_data in self.current_level_items_world_state.items():
-            if world_data.get("location") == room_name:
-                if self._norm(self._get_item_display_name(item_key)) == target_norm:
-                    master_data = self.resource_manager.get_data('items', {}).get(item_key, {})
-                    return {
-                        'id_key': item_key,
-                        'name': self._get_item_display_name(item_key),
-                        'type': 'item',
-                        'data': master_data
-                    }
+        for item_key in self.current_level_items_world_state.items_in_room(room_name):
+            if item_matches(item_key):
+                master_data = items_master.get(item_key, {})
+                return {
+                    'id_key': item_key,
+                    'name': self._get_item_display_name(item_key),
+                    'type': 'item',
+                    'data': master_data
+                }
 
         return None
 
@@ -2521,7 +2567,10 @@ class GameLogic:
 
     def _set_npc_state(self, npc: dict, state: str):
         key = self._npc_key(npc)
-        self.player.setdefault('npc_states', {})[key] = state
+        npc_states = self.player.setdefault('npc_states', {})
+        if npc_states.get(key) != state:
+            npc_states[key] = state
+            self.bump_room_version(npc.get('location') or self.player.get('location'))
 
     # --- REFINED: Perception Methods ---
     def _get_rich_room_description(self, room_id: str) -> str:
@@ -2529,7 +2578,18 @@ class GameLogic:
         Compiles a full description, now correctly passing the resource_manager
         to all color_text calls. Now includes NPCs present in the room.
         Ensures NPCs' visible state is updated by calling _resolve_npc_dialogue_entry_state.
+        Served from the room view cache while the room is unchanged.
         """
+        cache_key = ('description', room_id)
+        cached = self._room_view_cache.get(cache_key)
+        if cached is not None and cached[0] == self._room_view_key(room_id):
+            return cached[1]
+        description = self._build_rich_room_description(room_id)
+        # Keyed after the build: resolving NPC states may itself bump this room
+        self._room_view_cache[cache_key] = (self._room_view_key(room_id), description)
+        return description
+
+    def _build_rich_room_description(self, room_id: str) -> str:
         room_data = self.get_room_data(room_id)
         if not room_data:
             return "You are in a featureless void."
@@ -2621,9 +2681,8 @@ class GameLogic:
                     targets.add(f['name'])
                 for o in visible['objects']:
                     targets.add(o['name'])
-                for item_key, world_data in self.current_level_items_world_state.items():
-                    if world_data.get("location") == current_room_id:
-                        targets.add(self._get_item_display_name(item_key))
+                for item_key in self.current_level_items_world_state.items_in_room(current_room_id):
+                    targets.add(self._get_item_display_name(item_key))
                 self.logger.debug(f"get_available_targets: Examine targets: {targets}")
 
             elif verb in ('search',):
@@ -2634,11 +2693,10 @@ class GameLogic:
 
             elif verb in ('take', 'get'):
                 # 1) Loose items in the room (takeable)
-                for item_key, world_data in self.current_level_items_world_state.items():
-                    if world_data.get("location") == current_room_id:
-                        item_data = items_master.get(item_key, {})
-                        if item_data.get("takeable", False):
-                            targets.add(self._get_item_display_name(item_key))
+                for item_key in self.current_level_items_world_state.items_in_room(current_room_id):
+                    item_data = items_master.get(item_key, {})
+                    if item_data.get("takeable", False):
+                        targets.add(self._get_item_display_name(item_key))
 
                 # 2) Items in containers that have been searched (use exact flag id)
                 room_data = self.get_room_data(current_room_id) or {}
@@ -3587,6 +3645,8 @@ class GameLogic:
         if flag_name not in self.interaction_flags:
             self.logger.info(f"Interaction flag set: '{flag_name}'")
             self.interaction_flags.add(flag_name)
+            if self.hazard_engine:
+                self.hazard_engine.notify_flag_changed(flag_name)
         else:
             self.logger.debug(f"Interaction flag '{flag_name}' already set.")
 
@@ -3636,6 +3696,7 @@ class GameLogic:
         if 'flags' not in self.player:
             self.player['flags'] = set()
 
+        changed = (flag_name in self.player['flags']) != bool(value)
         if value:
             # Add the flag to the set
             self.player['flags'].add(flag_name)
@@ -3644,6 +3705,8 @@ class GameLogic:
             # Remove the flag from the set if it exists
             self.player['flags'].discard(flag_name)
             self.logger.info(f"Player flag removed: '{flag_name}'")
+        if changed and self.hazard_engine:
+            self.hazard_engine.notify_flag_changed(flag_name)
 
     def get_player_flag(self, flag_name: str) -> bool:
         """
@@ -3654,12 +3717,23 @@ class GameLogic:
         return flag_name in self.player.get('flags', set())
     
     def get_items_in_room(self, room_id: str) -> list:
-        """Returns a list of all item objects directly present in a specified room."""
-        room_data = self.current_level_data.get(room_id, {})
-        item_keys_in_room = room_data.get('items', [])
-        
-        items_in_room = [item for item in self.items_master_list if item['id'] in item_keys_in_room]
-        return items_in_room
+        """Returns a list of all item objects (master data plus 'id') lying loose in a specified room."""
+        items_master = self.resource_manager.get_data('items', {})
+        return [
+            {**items_master.get(item_key, {}), 'id': item_key}
+            for item_key in self.current_level_items_world_state.items_in_room(room_id)
+        ]
+
+    def _get_item_master_data(self, item_key: str) -> dict:
+        return self.resource_manager.get_data('items', {}).get(item_key, {})
+
+    def remove_item_from_world(self, item_key: str):
+        """Takes a loose item out of the level entirely (e.g. a launched projectile)."""
+        location = self.current_level_items_world_state.location_of(item_key)
+        if item_key in self.current_level_items_world_state:
+            del self.current_level_items_world_state[item_key]
+        if location:
+            self.bump_room_version(location)
 
     def _maybe_intercept_mri_key_take(self, item_key: str) -> Optional[dict]:
         """
@@ -3754,6 +3828,7 @@ class GameLogic:
                     if not (rid and fname): continue
                     r = self.current_level_rooms_world_state.get(rid) or {}
                     furns = r.get('furniture', [])
+                    self.bump_room_version(rid)
                     for f in furns:
                         if isinstance(f, dict) and self._norm(f.get('name','')) == self._norm(fname):
                             if et == 'unlock_furniture':
@@ -3934,6 +4009,7 @@ class GameLogic:
         Moves the companion NPC to the specified destination room.
         """
         companion_id = self.player.get('companion_id', None) or 'your_friend'
+        self.bump_room_version(self.player.get('companion_location'), destination)
         # Try player-local NPCs first
         npcs = self.player.get('npcs', {})
         if companion_id in npcs:
@@ -3964,14 +4040,14 @@ class GameLogic:
         for k, v in condition.items():
             if k.endswith("_state"):
                 hazard_type = k[:-6]
-                for hid, hazard in self.hazard_engine.active_hazards.items():
-                    if hazard.get('type') == hazard_type and hazard.get('location') == room:
+                for hid, hazard in self.hazard_engine.get_room_hazards_descriptions(room).items():
+                    if hazard.get('type') == hazard_type:
                         if hazard.get('state') == v:
                             return True
             elif k.endswith("_activated"):
                 hazard_type = k[:-10]
-                for hid, hazard in self.hazard_engine.active_hazards.items():
-                    if hazard.get('type') == hazard_type and hazard.get('location') == room:
+                for hid, hazard in self.hazard_engine.get_room_hazards_descriptions(room).items():
+                    if hazard.get('type') == hazard_type:
                         if hazard.get('started_by_player'):
                             return True
         return False
@@ -4090,8 +4166,8 @@ class GameLogic:
             self.logger.info(f"_use_main: Object '{target_str}' is linked to hazard '{hazard_type}'. Forwarding to HazardEngine.")
             # NEW: Check if hazard is in a usable state
             hazard_instance = None
-            for hid, hinst in (self.hazard_engine.active_hazards.items() if self.hazard_engine else []):
-                if hinst.get('type') == hazard_type and hinst.get('location') == current_room_id:
+            for hid, hinst in (self.hazard_engine.get_room_hazards_descriptions(current_room_id).items() if self.hazard_engine else []):
+                if hinst.get('type') == hazard_type:
                     hazard_instance = hinst
                     break
 
@@ -4324,9 +4400,7 @@ class GameLogic:
 
     def _unlock_exit(self, direction: str, dest_room_id: str, available_keys: dict) -> dict:
         """Unlock the specified exit if the player has the correct key."""
-        all_rooms = self.resource_manager.get_data('rooms', {})
-        level_rooms = all_rooms.get(str(self.player.get('current_level', 1)), {})
-        dest_data = level_rooms.get(dest_room_id)
+        dest_data = self.current_level_rooms_world_state.get(dest_room_id)
         if not dest_data:
             return self._build_response(
                 message=f"The way to {dest_room_id.replace('_', ' ')} seems blocked.",
@@ -4351,9 +4425,11 @@ class GameLogic:
                 self._norm(direction) in unlocks or
                 "*" in key_data.get("unlocks", []) or
                 key_data.get("is_master_key")):
-                locking["locked"] = False
-                if dest_room_id in self.current_level_rooms_world_state:
-                    self.current_level_rooms_world_state[dest_room_id]["locked"] = False
+                if isinstance(dest_data.get("locking"), dict):
+                    dest_data["locking"]["locked"] = False
+                dest_data["locked"] = False
+                if self.hazard_engine:
+                    self.hazard_engine.invalidate_routes()
                 self.logger.info(f"_command_unlock: Unlocked {dest_room_id} with {key_id}")
                 display_name = self._get_item_display_name(key_id)
                 message = f"You unlock the door to {dest_room_id.replace('_', ' ')} with the {display_name}."
@@ -4586,7 +4662,7 @@ class GameLogic:
                         omen_text = omen_options.get(hazard_state)
                     if not omen_text:
                         omen_text = next(iter(omen_options.values()))
-                elif isinstance(omen_options, list):
+                elif isinstance(omen_options, (list, tuple)):
                     omen_text = random.choice(omen_options)
                 elif omen_options is not None:
                     omen_text = str(omen_options)
@@ -4708,8 +4784,8 @@ class GameLogic:
                     mri_is_active = False
                     if self.hazard_engine:
                         hazards_master = self.resource_manager.get_data('hazards', {})
-                        for hid, h_inst in self.hazard_engine.active_hazards.items():
-                            if h_inst.get('type') == 'mri' and h_inst.get('location') == current_room_id:
+                        for hid, h_inst in self.hazard_engine.get_room_hazards_descriptions(current_room_id).items():
+                            if h_inst.get('type') == 'mri':
                                 state = h_inst.get('state')
                                 # Active magnetic states that make forcing fatal
                                 active_states = [
@@ -5,19 +5,51 @@ The Engine of Calamity.
 This system manages the state and progression of all environmental hazards.
 It operates autonomously each turn and responds to player interactions.
 """
+import heapq
 import logging
 from typing import Tuple
 from typing import Set, Tuple
 from typing import Union, Set, Tuple
 from typing import List, Set, Tuple
+from typing import Dict, FrozenSet
 import random
 import uuid
 from kivy.clock import Clock
 
 from typing import Optional, Tuple
-from .resource_manager import ResourceManager
+from .resource_manager import ResourceManager, normalize_name
 from .utils import color_text
 
+class CompiledInteractionRule:
+    """
+    A hazards.json interaction rule with its match criteria normalized once at load:
+    target names as a frozenset of normalized names, required states as a frozenset.
+    The original rule dict is kept untouched for side effects.
+    """
+    __slots__ = ('rule', 'target_names', 'required_states')
+
+    def __init__(self, rule: dict):
+        self.rule = rule
+        valid_targets = rule.get('on_target_name', [])
+        if not isinstance(valid_targets, list):
+            valid_targets = [valid_targets]
+        self.target_names = frozenset(normalize_name(v) for v in valid_targets if isinstance(v, str))
+        required = rule.get('requires_hazard_state')
+        if not required:
+            self.required_states = None
+        elif isinstance(required, str):
+            self.required_states = frozenset((required,))
+        else:
+            self.required_states = frozenset(required)
+
+    def matches(self, current_state: str, target_syns: FrozenSet[str]) -> bool:
+        if self.required_states is not None and current_state not in self.required_states:
+            return False
+        if self.target_names and self.target_names.isdisjoint(target_syns):
+            return False
+        return True
+
+
 class HazardEngine:
     def __init__(self, resource_manager: ResourceManager):
         self.resource_manager = resource_manager
@@ -28,7 +60,16 @@ class HazardEngine:
         self.game_logic = None 
         
         self.active_hazards = {}
+        # room name -> {hazard_id: None}; an insertion-ordered set kept in step with active_hazards.
+        self._hazards_by_room = {}
+        # Lazily built per level: start room -> {target room: first room to step into}. See _get_routing_table.
+        self._next_hop_table = None
+        self._room_order = {}
+        # Turn scheduler; see _reset_schedule.
+        self._reset_schedule()
         self.hazards_master_data = self.resource_manager.get_data('hazards', {})
+        # (hazard_type, verb) -> tuple of CompiledInteractionRule
+        self._compiled_rules = self._compile_interaction_rules(self.hazards_master_data)
         
         self.logger.info("Engine of Calamity initialized.")
 
@@ -36,13 +77,15 @@ class HazardEngine:
         """Resets and sets up hazards for the start of a new level, then spawns their entities."""
         self.logger.debug(f"Initializing hazards for level {level_id}. Clearing active hazards.")
         self.active_hazards.clear()
+        self._hazards_by_room.clear()
+        self._reset_schedule()
+        self.invalidate_routes()
         self.logger.info(f"Hazard Engine (re)initialized for Level {level_id}.")
         # Seed hazards and spawn their related entities from rooms config
         if not getattr(self, 'game_logic', None):
             self.logger.warning("HazardEngine.initialize_for_level: game_logic not set; cannot seed hazards/entities.")
             return
-        rooms = self.game_logic.current_level_rooms_world_state or {}
-        for room_name, room in rooms.items():
+        for room_name, room in self.game_logic._peek_room_items():
             hazard_entries = room.get('hazards_present') or room.get('hazards') or []
             for h in hazard_entries:
                 if isinstance(h, str):
@@ -100,6 +143,9 @@ class HazardEngine:
             "source_trigger_id": source_trigger_id,
             "started_by_player": False,  # respect requires_player_interaction_to_start
         }
+        self._index_hazard(hazard_id, location)
+        self._sync_flag_watch(hazard_id)
+        self._schedule_tick(hazard_id)
         self.logger.info(f"Spawned hazard '{hazard_type}' in '{location}' (id={hazard_id}) at state '{initial_state}'.")
 
         # Spawn any related room entities
@@ -116,14 +162,63 @@ class HazardEngine:
 
         return hazard_id
 
+    # --- Room -> hazard index ---
+
+    def _index_hazard(self, hazard_id: str, location: Optional[str]):
+        if location is not None:
+            self._hazards_by_room.setdefault(location, {})[hazard_id] = None
+            self._touch_room(location)
+
+    def _unindex_hazard(self, hazard_id: str, location: Optional[str]):
+        room_ids = self._hazards_by_room.get(location)
+        if room_ids is not None:
+            room_ids.pop(hazard_id, None)
+            if not room_ids:
+                del self._hazards_by_room[location]
+            self._touch_room(location)
+
+    def _touch_room(self, *room_ids):
+        """Tells GameLogic a room's contents changed so its cached views are rebuilt."""
+        if self.game_logic is not None:
+            self.game_logic.bump_room_version(*room_ids)
+
+    def _rebuild_room_index(self):
+        """Recompute the room index from scratch (after bulk replacement of active_hazards)."""
+        self._hazards_by_room = {}
+        for hazard_id, hazard in self.active_hazards.items():
+            self._index_hazard(hazard_id, hazard.get('location'))
+
+    def _move_hazard(self, hazard_id: str, new_location: str):
+        """The only sanctioned way to change a hazard's location; keeps the room index correct."""
+        hazard = self.active_hazards.get(hazard_id)
+        if not hazard:
+            return
+        self._unindex_hazard(hazard_id, hazard.get('location'))
+        hazard['location'] = new_location
+        self._index_hazard(hazard_id, new_location)
+
+    def remove_active_hazard(self, hazard_id: str) -> Optional[dict]:
+        """Unregister a hazard instance. Returns the removed instance, if any."""
+        hazard = self.active_hazards.pop(hazard_id, None)
+        if hazard is not None:
+            self._unindex_hazard(hazard_id, hazard.get('location'))
+            self._sync_flag_watch(hazard_id)
+            self._tick_due.pop(hazard_id, None)
+            self.logger.info(f"Removed hazard '{hazard_id}' from '{hazard.get('location')}'.")
+        return hazard
+
+    def get_hazard_ids_in_room(self, room_name: str) -> tuple:
+        """Snapshot of the hazard ids in a room, safe to iterate while hazards are added or moved."""
+        return tuple(self._hazards_by_room.get(room_name, ()))
+
     # Convenience used by DeathAI/escalation code
     def get_hazards_in_location(self, room_name: str) -> list:
         """Return all active hazard instances in a room."""
-        return [h for h in self.active_hazards.values() if h.get("location") == room_name]
+        return [self.active_hazards[hid] for hid in self._hazards_by_room.get(room_name, ())]
 
     def get_room_hazards_descriptions(self, room_name: str) -> dict:
         """Return a mapping of hazard_id -> hazard instance for a room (used by DeathAI)."""
-        return {hid: h for hid, h in self.active_hazards.items() if h.get("location") == room_name}
+        return {hid: self.active_hazards[hid] for hid in self._hazards_by_room.get(room_name, ())}
 
     def _spawn_entities_for_hazard(self, hazard_id: str):
         """Place hazard-related objects into the room, picking display names randomly per entity."""
@@ -139,6 +234,7 @@ class HazardEngine:
         room = rooms.get(room_name)
         if not room:
             return
+        self._touch_room(room_name)
 
         # Ensure objects list exists
         objs = room.get('objects')
@@ -254,26 +350,27 @@ class HazardEngine:
             messages.extend(ai_messages)
 
         # --- Hazard Progression & Movement Logic ---
-        for hazard_id, hazard in list(self.active_hazards.items()):
-            self.logger.debug(f"Processing hazard {hazard_id}: {hazard}")
-            current_state_key = hazard.get('state')
-            hazard_def = hazard.get('master_data', {})
-            state_data = (hazard_def.get('states') or {}).get(current_state_key, {})
-
-            # Existing autonomous actions
-            action = state_data.get('autonomous_action')
-            if action == '_check_progression_by_flags':
-                self._maybe_progress_on_flags(hazard_id)
-            elif action == '_check_icu_examination_flags':
-                self._check_icu_examination_flags(hazard)
-
-            # NEW: Process hazard movement if can_move_between_rooms and has movement_logic
-            if hazard_def.get('can_move_between_rooms') and hazard_def.get('movement_logic'):
-                self._process_hazard_movement(hazard_id)
-
-            # Death's Breath aura influence
-            if hazard.get('type') == 'deaths_breath':
-                self._influence_hazards_in_room(hazard_id)
+        # Only hazards with a wake-up due this turn are visited, in the order they were spawned.
+        turn = self._turn
+        order_limit = self._next_order
+        try:
+            while self._wakeups and self._wakeups[0][0] <= turn:
+                due, order, _, hazard_id, target_state = heapq.heappop(self._wakeups)
+                hazard = self.active_hazards.get(hazard_id)
+                if hazard is None:
+                    continue
+                self._draining = (order, order_limit)
+                if target_state is not None:
+                    self._handle_timed_transition(hazard_id, target_state)
+                    continue
+                if self._tick_due.get(hazard_id) != due:
+                    continue  # superseded or cancelled registration
+                del self._tick_due[hazard_id]
+                self._run_hazard_tick(hazard_id, hazard)
+                self._schedule_tick(hazard_id)
+        finally:
+            self._draining = None
+            self._turn += 1
 
         self.logger.debug(f"Turn complete. Messages: {messages}")
         return {
@@ -282,6 +379,168 @@ class HazardEngine:
             "qte_triggered": None
         }
     
+    def _run_hazard_tick(self, hazard_id: str, hazard: dict):
+        """The per-turn work of one hazard in its current state."""
+        current_state_key = hazard.get('state')
+        hazard_def = hazard.get('master_data', {})
+        state_data = (hazard_def.get('states') or {}).get(current_state_key, {})
+
+        # Existing autonomous actions
+        action = state_data.get('autonomous_action')
+        if action == '_check_progression_by_flags':
+            self._progress_if_flags_changed(hazard_id)
+        elif action == '_check_icu_examination_flags':
+            self._check_icu_examination_flags(hazard)
+
+        # NEW: Process hazard movement if can_move_between_rooms and has movement_logic
+        if hazard_def.get('can_move_between_rooms') and hazard_def.get('movement_logic'):
+            self._process_hazard_movement(hazard_id)
+
+        # Death's Breath aura influence
+        if hazard.get('type') == 'deaths_breath':
+            self._influence_hazards_in_room(hazard_id)
+
+    # --- Turn scheduler ---
+    # A heap of wake-ups keyed by turn: (turn, hazard order, seq, hazard_id, target_state).
+    # target_state is None for a per-turn tick, which a hazard holds while its current state
+    # has work every turn (see _has_turn_work) and renews after each run; otherwise it is a
+    # one-off timed transition. Ticks are cancelled lazily: _tick_due holds the live turn.
+
+    _TICK_ACTIONS = frozenset({'_check_progression_by_flags', '_check_icu_examination_flags'})
+
+    def _reset_schedule(self):
+        # Flag watches live and die with the schedule; see _sync_flag_watch.
+        self._flag_watchers: Dict[str, Dict[str, None]] = {}
+        self._watched_flags: Dict[str, FrozenSet[str]] = {}
+        self._flags_changed: Dict[str, None] = {}
+        self._wakeups: List[tuple] = []
+        self._tick_due: Dict[str, int] = {}
+        self._hazard_order: Dict[str, int] = {}
+        self._next_order = 0
+        self._wakeup_seq = 0
+        self._turn = 0
+        self._draining: Optional[Tuple[int, int]] = None
+
+    def _order_of(self, hazard_id: str) -> int:
+        order = self._hazard_order.get(hazard_id)
+        if order is None:
+            order = self._hazard_order[hazard_id] = self._next_order
+            self._next_order += 1
+        return order
+
+    def _push_wakeup(self, due: int, hazard_id: str, target_state: Optional[str] = None):
+        self._wakeup_seq += 1
+        heapq.heappush(self._wakeups, (due, self._order_of(hazard_id), self._wakeup_seq, hazard_id, target_state))
+
+    def _has_turn_work(self, hazard: dict) -> bool:
+        hazard_def = hazard.get('master_data') or {}
+        if hazard.get('type') == 'deaths_breath':
+            return True
+        if hazard_def.get('can_move_between_rooms') and hazard_def.get('movement_logic'):
+            return True
+        state_data = (hazard_def.get('states') or {}).get(hazard.get('state'), {})
+        action = state_data.get('autonomous_action')
+        if action == '_check_progression_by_flags':
+            # Nothing to re-check until one of the flags it waits on changes.
+            return hazard.get('id') in self._flags_changed
+        return action in self._TICK_ACTIONS
+
+    def _next_tick_turn(self, hazard_id: str) -> int:
+        """
+        The turn a new registration should fire on. Outside process_turn that is the next
+        call. During one, hazards still ahead of the cursor and already alive when the turn
+        began are picked up this turn, just as a full scan would have reached them.
+        """
+        if self._draining is None:
+            return self._turn
+        cursor, order_limit = self._draining
+        order = self._order_of(hazard_id)
+        return self._turn if cursor < order < order_limit else self._turn + 1
+
+    def _schedule_tick(self, hazard_id: str):
+        """(Re)registers or cancels a hazard's per-turn tick to match its current state."""
+        hazard = self.active_hazards.get(hazard_id)
+        if hazard is None or not self._has_turn_work(hazard):
+            self._tick_due.pop(hazard_id, None)
+            return
+        due = self._next_tick_turn(hazard_id)
+        current = self._tick_due.get(hazard_id)
+        if current is not None and current <= due:
+            return
+        self._tick_due[hazard_id] = due
+        self._push_wakeup(due, hazard_id)
+
+    def schedule_timed_transition(self, hazard_id: str, target_state: str, delay_turns: int = 1):
+        """Moves a hazard to target_state delay_turns turns from now, via _handle_timed_transition."""
+        base = self._turn if self._draining is None else self._turn + 1
+        self._push_wakeup(base + max(1, int(delay_turns)) - 1, hazard_id, target_state)
+
+    def _rebuild_schedule(self, timed_transitions=()):
+        """Re-registers every active hazard after a bulk replacement (e.g. loading a save)."""
+        self._reset_schedule()
+        for hazard_id in self.active_hazards:
+            self._order_of(hazard_id)
+            self._sync_flag_watch(hazard_id)
+            self._schedule_tick(hazard_id)
+        for entry in timed_transitions or ():
+            try:
+                delay_turns, hazard_id, target_state = entry
+            except (TypeError, ValueError):
+                continue
+            if hazard_id in self.active_hazards:
+                self.schedule_timed_transition(hazard_id, target_state, delay_turns)
+
+    def get_schedule_depth(self) -> dict:
+        """Diagnostics: hazards holding a per-turn tick and queued timed transitions."""
+        return {
+            "ticking_hazards": len(self._tick_due),
+            "flag_watching_hazards": len(self._watched_flags),
+            "timed_transitions": sum(1 for entry in self._wakeups if entry[4] is not None),
+            "heap_entries": len(self._wakeups),
+        }
+
+    # --- Flag-dependency index ---
+    # flag -> hazards whose current state's progression_condition lists it. A hazard's
+    # condition is re-evaluated only after one of those flags changes (notify_flag_changed)
+    # or it enters a state with a condition, never on a blind re-check.
+
+    def _sync_flag_watch(self, hazard_id: str):
+        """Re-indexes the flags a hazard waits on for its current state; call after it spawns, changes state or goes."""
+        for flag in self._watched_flags.pop(hazard_id, ()):
+            watchers = self._flag_watchers.get(flag)
+            if watchers is not None:
+                watchers.pop(hazard_id, None)
+                if not watchers:
+                    del self._flag_watchers[flag]
+        self._flags_changed.pop(hazard_id, None)
+
+        hazard = self.active_hazards.get(hazard_id)
+        if hazard is None:
+            return
+        states = (hazard.get('master_data') or {}).get('states') or {}
+        prog = (states.get(hazard.get('state')) or {}).get('progression_condition') or {}
+        flags = frozenset(prog.get('requires_all_flags') or ())
+        if not flags:
+            return
+        self._watched_flags[hazard_id] = flags
+        for flag in flags:
+            self._flag_watchers.setdefault(flag, {})[hazard_id] = None
+        # The flags may already be set when the state is entered.
+        self._flags_changed[hazard_id] = None
+
+    def notify_flag_changed(self, flag_name: str):
+        """Called by GameLogic when a player or interaction flag is set or cleared."""
+        for hazard_id in tuple(self._flag_watchers.get(flag_name, ())):
+            self._flags_changed[hazard_id] = None
+            self._schedule_tick(hazard_id)
+
+    def _progress_if_flags_changed(self, hazard_id: str) -> list:
+        """_maybe_progress_on_flags, but only if something it depends on changed since the last check."""
+        if hazard_id not in self._flags_changed:
+            return []
+        del self._flags_changed[hazard_id]
+        return self._maybe_progress_on_flags(hazard_id)
+
     def _process_hazard_movement(self, hazard_id: str):
         """
         Move hazards between rooms based on their movement_logic.
@@ -307,19 +566,21 @@ class HazardEngine:
         seekable_types = hazard_def.get('seekable_target_types', [])
         player_seek_chance = hazard_def.get('player_seek_chance_if_no_primary_target', 0.2)
 
-        # 1) Search all rooms for primary targets
+        # 1) Find the first room (in level order) holding a hazard of a seekable type
         target_room = None
-        for room_id, room_data in (self.game_logic.current_level_rooms_world_state or {}).items():
-            if room_id == current_location:
-                continue
-            # Check for hazards of seekable types in this room
-            for other_id, other_hazard in self.active_hazards.items():
-                if other_hazard.get('location') == room_id and other_hazard.get('type') in seekable_types:
-                    target_room = room_id
-                    self.logger.info(f"[{hazard_id}] Found target hazard '{other_hazard.get('type')}' in '{room_id}'")
-                    break
+        if seekable_types:
+            self._get_routing_table()
+            room_order = self._room_order
+            best_rank = None
+            for other_hazard in self.active_hazards.values():
+                room_id = other_hazard.get('location')
+                if room_id == current_location or other_hazard.get('type') not in seekable_types:
+                    continue
+                rank = room_order.get(room_id)
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_rank, target_room, target_type = rank, room_id, other_hazard.get('type')
             if target_room:
-                break
+                self.logger.info(f"[{hazard_id}] Found target hazard '{target_type}' in '{target_room}'")
 
         # 2) If no primary target, maybe seek player
         if not target_room and random.random() < player_seek_chance:
@@ -331,7 +592,7 @@ class HazardEngine:
             next_step = self._find_next_step_toward(current_location, target_room)
             if next_step:
                 self.logger.info(f"[{hazard_id}] Moving from '{current_location}' to '{next_step}' (toward '{target_room}')")
-                hazard['location'] = next_step
+                self._move_hazard(hazard_id, next_step)
                 # Respawn entities in new room
                 self._spawn_entities_for_hazard(hazard_id)
                 # Check for collisions in new room
@@ -339,31 +600,50 @@ class HazardEngine:
 
     def _find_next_step_toward(self, start: str, target: str) -> str | None:
         """
-        BFS pathfinding: return the first room to move to from 'start' toward 'target'.
+        Return the first room to move to from 'start' toward 'target', via the level's next-hop table.
         """
         if start == target:
             return None
+        return self._get_routing_table().get(start, {}).get(target)
+
+    def invalidate_routes(self):
+        """Forget the next-hop table; call whenever exits or door locks in the level change."""
+        self._next_hop_table = None
+
+    def _get_routing_table(self) -> dict:
+        """
+        Build (once per level, or after invalidate_routes) the all-pairs next-hop table with one BFS
+        from every room. Complex/dict exits are skipped, as hazard movement always has.
+        """
+        if self._next_hop_table is not None:
+            return self._next_hop_table
 
         from collections import deque
-        visited = {start}
-        queue = deque([(start, [start])])
-
-        while queue:
-            current, path = queue.popleft()
-            room_data = (self.game_logic.current_level_rooms_world_state or {}).get(current, {})
-            exits = room_data.get('exits', {})
-
-            for direction, dest in exits.items():
-                if isinstance(dest, dict):
-                    continue  # skip complex/locked exits
-                if dest == target:
-                    # Found target; return first step in path (after start)
-                    return path[1] if len(path) > 1 else dest
-                if dest not in visited:
-                    visited.add(dest)
-                    queue.append((dest, path + [dest]))
-
-        return None  # no path found
+        room_items = self.game_logic._peek_room_items() if self.game_logic else ()
+        adjacency = {
+            room_id: [dest for dest in (room_data.get('exits') or {}).values() if not isinstance(dest, dict)]
+            for room_id, room_data in room_items
+        }
+
+        table = {}
+        for start in adjacency:
+            first_hop = {}
+            visited = {start}
+            queue = deque([start])
+            while queue:
+                current = queue.popleft()
+                hop = first_hop.get(current)
+                for dest in adjacency.get(current, ()):
+                    if dest not in visited:
+                        visited.add(dest)
+                        first_hop[dest] = hop or dest
+                        queue.append(dest)
+            table[start] = first_hop
+
+        self._next_hop_table = table
+        self._room_order = {room_id: idx for idx, room_id in enumerate(adjacency)}
+        self.logger.debug(f"[_get_routing_table] Built next-hop table for {len(table)} rooms.")
+        return table
 
     def _check_hazard_collisions(self, hazard_id: str):
         """
@@ -400,8 +680,9 @@ class HazardEngine:
                         self.game_logic.player['status_effects'].append(status)
 
         # Check collision with other hazards in same room
-        for other_id, other_hazard in self.active_hazards.items():
-            if other_id == hazard_id or other_hazard.get('location') != location:
+        for other_id in self.get_hazard_ids_in_room(location):
+            other_hazard = self.active_hazards.get(other_id)
+            if other_id == hazard_id or not other_hazard:
                 continue
             other_type = other_hazard.get('type')
             effect = collision_effects.get(other_type)
@@ -642,7 +923,10 @@ class HazardEngine:
         try:
             prev_state = hazard.get('state')
             hazard['state'] = new_state
+            self._touch_room(hazard.get('location'))
             hazard_id = hazard.get('id', 'unknown')
+            self._sync_flag_watch(hazard_id)
+            self._schedule_tick(hazard_id)
             self.logger.info(f"[_update_hazard_state] Hazard '{hazard_id}' state changed from '{prev_state}' to '{new_state}'.")
         except Exception as e:
             self.logger.error(f"[_update_hazard_state] Failed to update hazard state: {e}", exc_info=True)
@@ -714,8 +998,8 @@ class HazardEngine:
         """Find existing hazard of type in location, or create new one."""
         try:
             # Search for existing
-            for h_id, h_inst in self.active_hazards.items():
-                if h_inst.get('type') == hazard_type and h_inst.get('location') == location:
+            for h_id, h_inst in self.get_room_hazards_descriptions(location).items():
+                if h_inst.get('type') == hazard_type:
                     return h_id
             
             # Create new
@@ -915,9 +1199,9 @@ class HazardEngine:
         potential_targets = []
         valid_target_types = {i.get('if_target_is') for i in interaction_rule.get('interactions', [])}
 
-        for hazard_id, hazard in self.active_hazards.items():
+        for hazard_id, hazard in self.get_room_hazards_descriptions(room_name).items():
             # A hazard cannot influence itself, and must be in the same room.
-            if hazard_id == self_id or hazard.get('location') != room_name:
+            if hazard_id == self_id:
                 continue
             
             # Check if the hazard is one of the types we can influence.
@@ -947,8 +1231,8 @@ class HazardEngine:
         except Exception:
             ht = hazard_type
             rn = room_name
-        for hid, inst in (self.active_hazards or {}).items():
-            if inst.get('location') == rn and (inst.get('type') or '').lower() == ht:
+        for hid, inst in self.get_room_hazards_descriptions(rn).items():
+            if (inst.get('type') or '').lower() == ht:
                 return hid
         return None
     
@@ -1005,22 +1289,28 @@ class HazardEngine:
                     room_data["original_locked_state"] = bool(room_data.get("locked"))
                 room_data["locked"] = True
                 room_data["locked_by_mri"] = True
+                self._touch_room(target)
                 locked += 1
             if locked:
+                self.invalidate_routes()
                 # Tell UI to refresh map immediately
                 self.game_logic.add_ui_event({"event_type": "refresh_map"})
 
         # MRI: unlock doors
         if action == 'mri_unlock_doors_and_release_items':
             restored = 0
-            for rid, rdata in self.game_logic.current_level_rooms_world_state.items():
+            rooms = self.game_logic.current_level_rooms_world_state
+            for rid, rdata in list(self.game_logic._peek_room_items()):
                 if rdata.get("locked_by_mri"):
+                    rdata = rooms[rid]
+                    self._touch_room(rid)
                     orig = bool(rdata.get("original_locked_state", False))
                     rdata["locked"] = orig
                     rdata.pop("locked_by_mri", None)
                     rdata.pop("original_locked_state", None)
                     restored += 1
             if restored:
+                self.invalidate_routes()
                 self.game_logic.add_ui_event({"event_type": "refresh_map"})
 
 
@@ -1069,11 +1359,13 @@ class HazardEngine:
             # Lock the room
             target_data["locked"] = True
             target_data["locked_by_mri"] = True
+            self._touch_room(target_room)
             locked_count += 1
             
             self.logger.info(f"[_action_mri_lock_doors] Locked '{target_room}' (from '{room_name}')")
         
         if locked_count > 0:
+            self.invalidate_routes()
             consequences.append({
                 "type": "show_popup",
                 "title": "Doors Sealed!",
@@ -1091,8 +1383,11 @@ class HazardEngine:
         
         # Find all rooms locked by MRI and restore their original state
         unlocked_count = 0
-        for room_id, room_data in self.game_logic.current_level_rooms_world_state.items():
+        rooms = self.game_logic.current_level_rooms_world_state
+        for room_id, room_data in list(self.game_logic._peek_room_items()):
             if room_data.get("locked_by_mri"):
+                room_data = rooms[room_id]
+                self._touch_room(room_id)
                 # Restore original lock state
                 original = room_data.get("original_locked_state", False)
                 room_data["locked"] = original
@@ -1102,6 +1397,7 @@ class HazardEngine:
                 self.logger.info(f"[_action_mri_unlock_doors] Unlocked '{room_id}'")
         
         if unlocked_count > 0:
+            self.invalidate_routes()
             consequences.append({
                 "type": "show_popup",
                 "title": "Magnetic Field Collapsed",
@@ -1182,16 +1478,9 @@ class HazardEngine:
         except Exception:
             return str(s).strip().lower().replace('_', ' ')
 
-    def _synonyms_for(self, name: str, items_master: dict) -> Set[str]:
-        """Build alias/synonym set for a typed target using items.json"""
-        norm = self._norm_text
-        syns = {norm(name)}
-        for key, data in items_master.items():
-            names = {norm(key), norm(data.get('name', key))}
-            aliases = {norm(a) for a in (data.get('aliases') or [])}
-            if norm(name) in names or norm(name) in aliases:
-                syns |= Union[names, aliases]
-        return syns
+    def _synonyms_for(self, name: str) -> FrozenSet[str]:
+        """Alias/synonym set for a typed target, served from the ResourceManager's items.json alias index."""
+        return self.resource_manager.get_synonyms(name)
 
     def _collect_rules_for_hazard(self, h_master: dict, verb: str) -> List[dict]:
         """Merge player_interaction[verb] with triggered_by_room_action rules for same verb."""
@@ -1202,20 +1491,29 @@ class HazardEngine:
         ]
         return list(pi_rules) + tra_rules
 
-    def _rule_matches(self, rule: dict, current_state: str, target_syns: Set[str]) -> bool:
-        """Check required state and target names against synonyms."""
-        norm = self._norm_text
-        valid_targets = rule.get('on_target_name', [])
-        if not isinstance(valid_targets, list):
-            valid_targets = [valid_targets]
-        valid_targets_norm = {norm(v) for v in valid_targets if isinstance(v, str)}
-        required_states = rule.get('requires_hazard_state')
-
-        if required_states and current_state not in required_states:
-            return False
-        if valid_targets_norm and target_syns.isdisjoint(valid_targets_norm):
-            return False
-        return True
+    def _compile_interaction_rules(self, hazards_master: dict) -> Dict[Tuple[str, str], tuple]:
+        """Pre-merge and pre-normalize every hazard's interaction rules, keyed by (hazard_type, verb)."""
+        compiled = {}
+        for hazard_type, h_master in (hazards_master or {}).items():
+            if not isinstance(h_master, dict):
+                continue
+            verbs = set((h_master.get('player_interaction', {}) or {}).keys())
+            verbs.update(
+                r.get('action_verb') for r in (h_master.get('triggered_by_room_action', []) or [])
+                if isinstance(r, dict) and r.get('action_verb')
+            )
+            for verb in verbs:
+                rules = self._collect_rules_for_hazard(h_master, verb)
+                if rules:
+                    compiled[(hazard_type, verb)] = tuple(CompiledInteractionRule(r) for r in rules)
+        self.logger.info(f"Compiled interaction rules for {len(compiled)} (hazard, verb) pairs.")
+        return compiled
+
+    def _get_compiled_rules(self, hazard_type: str, verb: str, h_master: dict) -> tuple:
+        """Compiled rules for a hazard instance; hazards unknown to master data are compiled on the fly."""
+        if hazard_type in self.hazards_master_data:
+            return self._compiled_rules.get((hazard_type, verb), ())
+        return tuple(CompiledInteractionRule(r) for r in self._collect_rules_for_hazard(h_master, verb))
 
     def _apply_rule_side_effects(self, hazard_id: str, rule: dict) -> Tuple[list, list, bool]:
         """
@@ -1305,12 +1603,12 @@ class HazardEngine:
             return {"consequences": consequences, "messages": messages, "blocks_action": False}
 
         player_location = self.game_logic.player.get('location')
-        items_master = self.resource_manager.get_data('items', {})
-        target_syns = self._synonyms_for(target, items_master)
+        target_syns = self._synonyms_for(target)
 
         self.logger.debug(f"[process_player_interaction] Player location: {player_location}")
-        for hazard_id, hazard_data in self.active_hazards.items():
-            if hazard_data.get('location') != player_location:
+        for hazard_id in self.get_hazard_ids_in_room(player_location):
+            hazard_data = self.active_hazards.get(hazard_id)
+            if not hazard_data:
                 continue
             hazard_def = hazard_data.get('master_data', {})
             current_state = hazard_data.get('state')
@@ -1321,13 +1619,14 @@ class HazardEngine:
                 continue
 
             h_master = hazard_def or {}
-            all_rules = self._collect_rules_for_hazard(h_master, verb)
+            all_rules = self._get_compiled_rules(hazard_data.get('type'), verb, h_master)
             self.logger.debug(f"[process_player_interaction] Found {len(all_rules)} rules for verb '{verb}'")
 
-            for rule_idx, rule in enumerate(all_rules):
-                self.logger.debug(f"[process_player_interaction] Evaluating rule #{rule_idx}: {rule}")
-                if not self._rule_matches(rule, current_state, target_syns):
+            for rule_idx, compiled_rule in enumerate(all_rules):
+                if not compiled_rule.matches(current_state, target_syns):
                     continue
+                rule = compiled_rule.rule
+                self.logger.debug(f"[process_player_interaction] Matched rule #{rule_idx}: {rule}")
 
                 matched_rules.append(rule)
                 hazard_data['started_by_player'] = True
@@ -1340,18 +1639,17 @@ class HazardEngine:
                     messages.extend(rule_msgs)
 
                 # After each matched rule, we may progress by flags; append consequences
-                progressed_cons = self._maybe_progress_on_flags(hazard_id)
+                progressed_cons = self._progress_if_flags_changed(hazard_id)
                 if progressed_cons:
                     consequences.extend(progressed_cons)
 
         # SAFETY NET: run flag progression once more after rules to catch pure-flag paths
         try:
             player_location = self.game_logic.player.get('location')
-            for hid, hz in self.active_hazards.items():
-                if hz.get('location') == player_location:
-                    extra_cons = self._maybe_progress_on_flags(hid)
-                    if extra_cons:
-                        consequences.extend(extra_cons)
+            for hid in self.get_hazard_ids_in_room(player_location):
+                extra_cons = self._progress_if_flags_changed(hid)
+                if extra_cons:
+                    consequences.extend(extra_cons)
         except Exception as e:
             self.logger.error(f"[process_player_interaction] post-flag progression failed: {e}", exc_info=True)
 
@@ -1368,10 +1666,7 @@ class HazardEngine:
         Enhanced with robust logging and debugging.
         """
         self.logger.debug(f"[get_active_hazards_for_room] Called for room: '{room_name}'")
-        hazards_in_room = [
-            h['type'] for h in self.active_hazards.values()
-            if h.get('location') == room_name
-        ]
+        hazards_in_room = [h['type'] for h in self.get_hazards_in_location(room_name)]
         self.logger.info(f"[get_active_hazards_for_room] Found hazards in '{room_name}': {hazards_in_room}")
         return hazards_in_room
 
@@ -1381,9 +1676,9 @@ class HazardEngine:
         Enhanced with robust logging and debugging.
         """
         self.logger.debug(f"[get_hazard_state] Called for hazard_key='{hazard_key}', room_name='{room_name}'")
-        for hazard_id, hazard in self.active_hazards.items():
+        for hazard_id, hazard in self.get_room_hazards_descriptions(room_name).items():
             self.logger.debug(f"[get_hazard_state] Checking hazard '{hazard_id}' (type='{hazard.get('type')}', location='{hazard.get('location')}')")
-            if hazard.get('type') == hazard_key and hazard.get('location') == room_name:
+            if hazard.get('type') == hazard_key:
                 state = hazard.get('state')
                 self.logger.info(f"[get_hazard_state] Found hazard '{hazard_key}' in '{room_name}' with state '{state}'")
                 return state
@@ -1404,7 +1699,7 @@ class HazardEngine:
         self.logger.debug(f"Required flags: {required_flags}, current flags: {self.game_logic.interaction_flags}")
         if required_flags.issubset(self.game_logic.interaction_flags):
             self.logger.info("Ventilator hazard progressing due to player examination.")
-            hazard['state'] = 'erratic_hiss'  # Or whatever the next state is
+            self._update_hazard_state(hazard, 'erratic_hiss')  # Or whatever the next state is
             self.logger.debug(f"Hazard state updated to 'erratic_hiss' for hazard: {hazard}")
             # We would also append a message about the change here.
 
@@ -1528,18 +1823,55 @@ class HazardEngine:
             self.logger.error(f"[_action_find_and_launch_projectile] Could not trigger QTE for projectile '{projectile_key}'. QTE info missing or engine not found.")
 
     def get_save_state(self) -> dict:
-        """Get the current state for saving."""
+        """
+        Get the current state for saving. Hazards are stored by type and state only;
+        their definitions are looked up again from master data on load.
+        """
+        hazards = {
+            hazard_id: {k: v for k, v in hazard.items() if k != 'master_data'}
+            for hazard_id, hazard in self.active_hazards.items()
+        }
+        timed_transitions = sorted(
+            [due - self._turn + 1, hazard_id, target_state]
+            for due, _, _, hazard_id, target_state in self._wakeups
+            if target_state is not None and hazard_id in self.active_hazards
+        )
         return {
-            "active_hazards": self.active_hazards.copy(),
+            "format": 2,
+            "hazards": hazards,
+            "timed_transitions": timed_transitions,
             "escalation_level": getattr(self, 'escalation_level', 0),
             "room_hazard_counters": getattr(self, 'room_hazard_counters', {}),
             "global_flags": getattr(self, 'global_flags', {})
         }
+
+    def _rehydrate_hazards(self, saved_hazards: dict) -> dict:
+        """Re-attaches master definitions to saved hazard instances, dropping types that no longer exist."""
+        active = {}
+        for hazard_id, saved in (saved_hazards or {}).items():
+            hazard_type = saved.get('type')
+            h_def = self.hazards_master_data.get(hazard_type)
+            if h_def is None:
+                # Legacy saves embedded the definition; fall back to it rather than lose the hazard.
+                h_def = saved.get('master_data')
+            if not h_def:
+                self.logger.warning(f"[_rehydrate_hazards] Unknown hazard type '{hazard_type}' for '{hazard_id}'; skipping.")
+                continue
+            hazard = dict(saved)
+            hazard['master_data'] = h_def
+            active[hazard_id] = hazard
+        return active
     
     def load_save_state(self, state_data: dict):
         """Restore state from save data."""
         try:
-            self.active_hazards = state_data.get("active_hazards", {})
+            saved_hazards = state_data.get("hazards")
+            if saved_hazards is None:
+                saved_hazards = state_data.get("active_hazards", {})
+            self.active_hazards = self._rehydrate_hazards(saved_hazards)
+            self._rebuild_room_index()
+            self._rebuild_schedule(state_data.get("timed_transitions", ()))
+            self.invalidate_routes()
             if hasattr(self, 'escalation_level'):
                 self.escalation_level = state_data.get("escalation_level", 0)
             if hasattr(self, 'room_hazard_counters'):
@@ -1551,19 +1883,6 @@ class HazardEngine:
         except Exception as e:
             self.logger.error(f"Failed to restore hazard engine state: {e}", exc_info=True)
         
-    def _synonyms_for(self, name: str, items_master: dict) -> Set[str]:
-        """Build alias/synonym set for a typed target using items.json"""
-        norm = self._norm_text
-        syns = {norm(name)}
-        for key, data in items_master.items():
-            names = {norm(key), norm(data.get('name', key))}
-            aliases = {norm(a) for a in (data.get('aliases') or [])}
-            if norm(name) in names or norm(name) in aliases:
-                # Use update() to avoid accidental replacement with typing.Union
-                syns.update(names)
-                syns.update(aliases)
-        return syns
-
 
     def _get_next_state_for(self, hazard_inst: dict) -> str | None:
         """Return configured next_state for a hazard instance, if any."""
@@ -1594,10 +1913,9 @@ class HazardEngine:
             "malevolent_gust": 0.30,
         }.get(state, 0.08)
 
-        for hid, inst in list(self.active_hazards.items()):
-            if hid == source_hazard_id:
-                continue
-            if inst.get("location") != room:
+        for hid in self.get_hazard_ids_in_room(room):
+            inst = self.active_hazards.get(hid)
+            if hid == source_hazard_id or not inst:
                 continue
 
             # Skip terminal/safe states (we won't re-awaken safe_exit_ending etc.)
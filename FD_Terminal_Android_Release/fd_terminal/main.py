@@ -34,6 +34,7 @@ from .resource_manager import ResourceManager
 from .hazard_engine import HazardEngine
 from .achievements import AchievementsSystem
 from .death_ai import DeathAI
+from .utils import read_save_header, get_save_writer
 from kivy.config import ConfigParser
 from kivy.uix.settings import SettingsWithSidebar
 
@@ -54,7 +55,7 @@ class FinalDestinationApp(App):
         self._configure_app_logging()
 
         # --- 1. Forge the Grand Library (ResourceManager) ---
-        self.resource_manager = ResourceManager()
+        self.resource_manager = ResourceManager(cache_dir=self.user_data_dir)
         self.resource_manager.load_master_data()
 
         # --- 2. Appoint the Chronicler (AchievementsSystem) ---
@@ -282,6 +283,9 @@ class FinalDestinationApp(App):
         """Called when the application is closing."""
         self.logger.info("Application stopping.")
         self.achievements_system.save_achievements()
+        # Don't let the process exit with a save still on its way to disk
+        if not get_save_writer().wait(timeout=5.0):
+            self.logger.warning("on_stop: A pending save did not finish writing.")
 
     def build_config(self, config):
         config.setdefaults('Display', {
@@ -334,17 +338,21 @@ class FinalDestinationApp(App):
                 return
 
             for filename in os.listdir(save_dir):
+                if filename.startswith('.savegame_') and filename.endswith('.tmp'):
+                    # Left behind by a save interrupted before its atomic rename; the slot itself is intact
+                    try:
+                        os.remove(os.path.join(save_dir, filename))
+                    except OSError as e:
+                        self.logger.error(f"Could not remove stale temp save {filename}: {e}")
+                    continue
                 if not filename.endswith('.json'):
                     continue
 
                 filepath = os.path.join(save_dir, filename)
                 try:
-                    with open(filepath, encoding='utf-8') as f:
-                        if not f.read().strip():
-                            continue
-                        f.seek(0)
-                        json.load(f)
-                except json.JSONDecodeError:
+                    # Header plus a size check; the payload checksum is verified when the save is loaded
+                    read_save_header(filepath)
+                except ValueError:
                     backup_path = filepath + ".corrupted"
                     try:
                         os.rename(filepath, backup_path)
@@ -5,9 +5,18 @@ try:
     from typing import TypedDict, NotRequired
 except ImportError:
     from typing_extensions import TypedDict, NotRequired
+import copy
 import json
+import hashlib
 import logging
+import marshal
+import re
 import sys
+from types import MappingProxyType
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Mapping, MutableMapping
+from typing import Callable, FrozenSet, Iterator, NamedTuple
 from typing import Type, get_type_hints, get_args, get_origin, Any, Union, List, Dict
 
 try:
@@ -24,17 +33,227 @@ from .schemas import (
     QTEDefinitionTypedDict, StatusEffectsFileTypedDict, SurvivorFatesFileTypedDict,
     TemperatureMappingsFileTypedDict, VisionariesFileTypedDict, NPCTypedDict
 )
+from . import schemas
+
+# Bump whenever the layout of the compiled cache blob changes.
+MASTER_DATA_CACHE_VERSION = 1
+MASTER_DATA_CACHE_STEM = "master_data"
+# Upper bound on loader threads; phones rarely benefit from more.
+MAX_LOADER_THREADS = 4
+
+_NAME_SEPARATORS = re.compile(r'[\s_]+')
+
+
+@lru_cache(maxsize=4096)
+def normalize_name(s: str) -> str:
+    """Normalize names for matching: lowercase, strip, collapse spaces/underscores."""
+    if not isinstance(s, str):
+        return ""
+    return _NAME_SEPARATORS.sub(' ', s.strip().lower())
+
+
+class LazyLevelRooms(Mapping):
+    """
+    The Atlas of Levels.
+    A read-only mapping of level id -> rooms dict. Each level's rooms file is only
+    parsed and validated the first time that level is looked up, and a finished
+    level can be released again to give its memory back.
+    """
+    def __init__(self, loader: Callable[[str, str], dict]):
+        self._loader = loader
+        self._sources: Dict[str, str] = {}
+        self._levels: Dict[str, dict] = {}
+
+    def register(self, level_id: str, file_path: str):
+        self._sources[str(level_id)] = file_path
+        self._levels.pop(str(level_id), None)
+
+    def __getitem__(self, level_id) -> dict:
+        level_id = str(level_id)
+        rooms = self._levels.get(level_id)
+        if rooms is None:
+            if level_id not in self._sources:
+                raise KeyError(level_id)
+            rooms = self._loader(level_id, self._sources[level_id])
+            self._levels[level_id] = rooms
+        return rooms
+
+    def __contains__(self, level_id) -> bool:
+        return str(level_id) in self._sources
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sources)
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def is_loaded(self, level_id) -> bool:
+        return str(level_id) in self._levels
+
+    def release(self, level_id) -> bool:
+        """Drops a loaded level; it will be re-read from disk (or the compiled cache) on next access."""
+        return self._levels.pop(str(level_id), None) is not None
+
+    def release_all_except(self, keep_level_id) -> List[str]:
+        keep = str(keep_level_id)
+        released = [lid for lid in self._levels if lid != keep]
+        for lid in released:
+            del self._levels[lid]
+        return released
+
+class LevelWorldState(MutableMapping):
+    """
+    The Living Map.
+    A copy-on-write view of one level's rooms. The master room data is shared and
+    never touched; a room is only copied into the private layer the first time
+    it is handed out for use, so a level costs nothing until the player (or a
+    hazard) actually reaches into it. Read-only scans should go through peek()
+    or peek_items() so they don't copy rooms they only look at.
+    """
+    def __init__(self, master_rooms: Mapping, overrides: Optional[dict] = None, removed=()):
+        self._master = master_rooms if master_rooms is not None else {}
+        self._rooms: Dict[str, dict] = {}
+        self._removed = set(removed or ())
+        for room_id, room_data in (overrides or {}).items():
+            self._rooms[room_id] = room_data
+            self._removed.discard(room_id)
+
+    def __getitem__(self, room_id) -> dict:
+        room = self._rooms.get(room_id)
+        if room is None:
+            if room_id in self._removed or room_id not in self._master:
+                raise KeyError(room_id)
+            room = copy.deepcopy(self._master[room_id])
+            self._rooms[room_id] = room
+        return room
+
+    def __setitem__(self, room_id, room_data: dict):
+        self._rooms[room_id] = room_data
+        self._removed.discard(room_id)
+
+    def __delitem__(self, room_id):
+        if room_id not in self:
+            raise KeyError(room_id)
+        self._rooms.pop(room_id, None)
+        if room_id in self._master:
+            self._removed.add(room_id)
+
+    def __contains__(self, room_id) -> bool:
+        if room_id in self._rooms:
+            return True
+        return room_id in self._master and room_id not in self._removed
+
+    def __iter__(self) -> Iterator[str]:
+        for room_id in self._master:
+            if room_id not in self._removed:
+                yield room_id
+        for room_id in [rid for rid in self._rooms if rid not in self._master]:
+            yield room_id
+
+    def __len__(self) -> int:
+        extra = sum(1 for room_id in self._rooms if room_id not in self._master)
+        return len(self._master) - len(self._removed & self._master.keys()) + extra
+
+    def peek(self, room_id, default=None):
+        """Returns the live room if it has been copied, else the shared master room. Never mutate the result."""
+        room = self._rooms.get(room_id)
+        if room is not None:
+            return room
+        if room_id in self._removed:
+            return default
+        return self._master.get(room_id, default)
+
+    def peek_items(self) -> Iterator[Tuple[str, dict]]:
+        for room_id in self:
+            yield room_id, self.peek(room_id)
+
+    def is_materialized(self, room_id) -> bool:
+        return room_id in self._rooms
+
+    def export_delta(self) -> Tuple[Dict[str, dict], List[str]]:
+        """Returns (rooms that differ from master, ids of master rooms that were removed)."""
+        changed = {
+            room_id: room_data for room_id, room_data in self._rooms.items()
+            if self._master.get(room_id) != room_data
+        }
+        return changed, sorted(self._removed)
+
+class LevelItemState(MutableMapping):
+    """
+    The Ledger of Things.
+    Loose items of the current level: item key -> {"location": room}, with a reverse
+    room -> items index kept in step so per-room queries only see that room's contents.
+    Entries are replaced or deleted as a whole (use move()); don't edit 'location' in place.
+    """
+    def __init__(self, entries: Optional[Mapping] = None):
+        self._items: Dict[str, dict] = {}
+        self._by_room: Dict[str, Dict[str, None]] = {}
+        for item_key, item_state in (entries or {}).items():
+            self[item_key] = item_state
+
+    def __getitem__(self, item_key) -> dict:
+        return self._items[item_key]
+
+    def __setitem__(self, item_key, item_state: dict):
+        old = self._items.get(item_key)
+        if old is not None:
+            self._unindex(item_key, old.get('location'))
+        self._items[item_key] = item_state
+        location = item_state.get('location')
+        if location is not None:
+            self._by_room.setdefault(location, {})[item_key] = None
+
+    def __delitem__(self, item_key):
+        old = self._items.pop(item_key)
+        self._unindex(item_key, old.get('location'))
+
+    def _unindex(self, item_key, location):
+        room_items = self._by_room.get(location)
+        if room_items is not None:
+            room_items.pop(item_key, None)
+            if not room_items:
+                del self._by_room[location]
+
+    def __contains__(self, item_key) -> bool:
+        return item_key in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def items_in_room(self, room_id) -> Tuple[str, ...]:
+        """Item keys lying loose in a room, in placement order. A snapshot, so callers may delete while looping."""
+        return tuple(self._by_room.get(room_id, ()))
+
+    def location_of(self, item_key) -> Optional[str]:
+        state = self._items.get(item_key)
+        return state.get('location') if state else None
+
+    def move(self, item_key, room_id):
+        self[item_key] = {**self._items.get(item_key, {}), 'location': room_id}
+
+    def copy(self) -> Dict[str, dict]:
+        return {item_key: dict(item_state) for item_key, item_state in self._items.items()}
+
+class LevelItemLayout(NamedTuple):
+    """What a level's room data says about items, derived once per level (see get_level_item_layout)."""
+    static_items: Dict[str, str]       # item key -> id of the first room listing it
+    container_rooms: Tuple[str, ...]   # rooms with at least one container, in level order
 
 class ResourceManager:
     """
     The Grand Library.
     Manages loading and VALIDATING all game data from external JSON files.
     """
-    def __init__(self, app_root: str = None):
+    def __init__(self, app_root: str = None, cache_dir: Optional[str] = None):
         """
         Initializes the ResourceManager.
         If app_root is not provided, it will robustly determine the project's
         root directory, assuming 'data' is a sibling to the 'fd_terminal' package.
+        If cache_dir is provided (normally the App's user_data_dir), parsed and
+        validated data is kept there in a compiled cache keyed by file content hash.
         """
         if app_root is None:
             # This is the corrected logic. It finds the directory of the current file
@@ -43,7 +262,14 @@ class ResourceManager:
             app_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
         
         self.app_root = app_root
+        self.cache_dir = cache_dir
         self.master_data = {}
+        # Built from items.json once master data is loaded; see _build_name_indexes.
+        self.alias_index: Dict[str, FrozenSet[str]] = {}
+        self.item_name_index: Dict[str, FrozenSet[str]] = {}
+        self._level_item_layouts: Dict[str, LevelItemLayout] = {}
+        self._global_omens: Optional[Dict[str, Tuple[str, ...]]] = None
+        self._level_omens: Dict[str, Mapping] = {}
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"ResourceManager initialized with app_root: {self.app_root}")
 
@@ -104,56 +330,227 @@ class ResourceManager:
             raise FileNotFoundError("Critical Error: The game's 'data' directory could not be located.")
 
         has_errors = False
+        cached_files = self._read_compiled_cache()
+        compiled_files = {}
+        cache_dirty = False
+
+        # Pass 1: decide what each file needs. Files whose compiled-cache entry is still current are
+        # resolved inline; the rest are parsed and validated on worker threads. Workers buffer their
+        # log lines so pass 2 can replay them in directory order, exactly as a sequential load would.
+        jobs = []
+        pool = None
         for filename in os.listdir(data_dir):
             if not filename.lower().endswith('.json'):
                 continue
 
             file_path = os.path.join(data_dir, filename)
             key_name = os.path.splitext(filename)[0]
+            log_records = []
+
+            # Room files are only registered here; LazyLevelRooms loads them on first access.
+            if key_name.startswith('rooms_level_'):
+                jobs.append((filename, file_path, key_name, log_records, None))
+                continue
 
+            entry = cached_files.get(filename)
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                # Find the correct law (schema) for this scroll (file)
-                schema = self.schema_map.get(key_name)
-                if schema:
-                    self.logger.info(f"Validating '{filename}' against schema '{schema.__name__}'...")
-                    is_valid, errors = self._validate_data(data, schema)
-                    if not is_valid:
-                        for error in errors:
-                            self.logger.error(f"Schema validation FAILED for '{filename}': {error}")
+                fresh = bool(entry) and entry.get('signature') == self._file_signature(file_path)
+            except OSError:
+                fresh = False
+            if fresh:
+                job = self._load_data_file(filename, file_path, key_name, entry, log_records)
+            else:
+                if pool is None:
+                    pool = ThreadPoolExecutor(max_workers=min(MAX_LOADER_THREADS, os.cpu_count() or 1),
+                                              thread_name_prefix="MasterDataLoader")
+                job = pool.submit(self._load_data_file, filename, file_path, key_name, entry, log_records)
+            jobs.append((filename, file_path, key_name, log_records, job))
+
+        # Pass 2: merge deterministically, in directory order.
+        try:
+            for filename, file_path, key_name, log_records, job in jobs:
+                if job is None:
+                    level_id = key_name.split('_')[-1]
+                    if 'rooms' not in self.master_data:
+                        self.master_data['rooms'] = LazyLevelRooms(self._load_room_level)
+                    self.master_data['rooms'].register(level_id, file_path)
+                    self.logger.info(f"Registered '{filename}' for on-demand loading as level '{level_id}'.")
+                    continue
+
+                try:
+                    try:
+                        data, entry, changed = job if isinstance(job, tuple) else job.result()
+                    finally:
+                        for level, message in log_records:
+                            self.logger.log(level, message)
+                    if entry is None:
                         has_errors = True
                         continue # Do not load a file that breaks the law
-                else:
-                    self.logger.warning(f"No schema defined for '{filename}'. Skipping validation.")
-                
-                # Special handling for files that need to be merged or restructured
-                if key_name.startswith('rooms_level_'):
-                    if 'rooms' not in self.master_data:
-                        self.master_data['rooms'] = {}
-                    level_id = key_name.split('_')[-1]
-                    self.master_data['rooms'][level_id] = data
-                else:
+                    cache_dirty = cache_dirty or changed
+                    compiled_files[filename] = entry
                     self.master_data[key_name] = data
 
-                self.logger.info(f"Successfully loaded and validated '{filename}'.")
-
-            except json.JSONDecodeError as e:
-                self.logger.error(f"Failed to load '{filename}': Invalid JSON syntax - {e}")
-                has_errors = True
-            except Exception as e:
-                self.logger.error(f"An unexpected error occurred processing '{filename}': {e}", exc_info=True)
-                has_errors = True
+                except json.JSONDecodeError as e:
+                    self.logger.error(f"Failed to load '{filename}': Invalid JSON syntax - {e}")
+                    has_errors = True
+                except Exception as e:
+                    self.logger.error(f"An unexpected error occurred processing '{filename}': {e}", exc_info=True)
+                    has_errors = True
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
 
         if has_errors:
             error_msg = "One or more critical data files failed to load or validate. The game cannot start."
             self.logger.critical(error_msg)
             raise ValueError(error_msg)
             
+        if cache_dirty or set(compiled_files) != set(cached_files):
+            self._write_compiled_cache(compiled_files)
+
+        self._build_name_indexes()
+        self._level_item_layouts.clear()
+        self._global_omens = None
+        self._level_omens.clear()
         self.logger.info("All master data has been successfully loaded and validated.")
         return self.master_data
 
+    def _load_data_file(self, filename: str, file_path: str, key_name: str, entry: Optional[dict],
+                        log_records: Optional[list] = None) -> Tuple[Any, Optional[dict], bool]:
+        """
+        Loads and validates one data file, reusing its compiled-cache entry while the file is unchanged.
+        Returns (data, cache_entry, cache_changed). cache_entry is None if the file failed validation;
+        the individual errors have already been logged.
+        Safe to run on a worker thread: pass log_records to collect (level, message) pairs instead of logging.
+        """
+        def log(level: int, message: str):
+            if log_records is None:
+                self.logger.log(level, message)
+            else:
+                log_records.append((level, message))
+
+        signature = self._file_signature(file_path)
+        if entry and entry.get('signature') == signature:
+            log(logging.INFO, f"Loaded '{filename}' from compiled cache.")
+            return entry['data'], entry, False
+
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        content_hash = hashlib.sha1(raw).hexdigest()
+
+        if entry and entry.get('hash') == content_hash:
+            # Touched but unchanged: reuse the validated data, just refresh the stat signature.
+            log(logging.INFO, f"Loaded '{filename}' from compiled cache (content unchanged).")
+            return entry['data'], {**entry, 'signature': signature}, True
+
+        data = json.loads(raw.decode('utf-8'))
+
+        # Find the correct law (schema) for this scroll (file)
+        schema = self.schema_map.get(key_name)
+        if schema:
+            log(logging.INFO, f"Validating '{filename}' against schema '{schema.__name__}'...")
+            is_valid, errors = self._validate_data(data, schema)
+            if not is_valid:
+                for error in errors:
+                    log(logging.ERROR, f"Schema validation FAILED for '{filename}': {error}")
+                return data, None, False
+        else:
+            log(logging.WARNING, f"No schema defined for '{filename}'. Skipping validation.")
+
+        log(logging.INFO, f"Successfully loaded and validated '{filename}'.")
+        return data, {'hash': content_hash, 'signature': signature, 'data': data}, True
+
+    def _load_room_level(self, level_id: str, file_path: str) -> dict:
+        """Loader behind LazyLevelRooms: parses and validates a single rooms_level_X file on demand."""
+        filename = os.path.basename(file_path)
+        key_name = os.path.splitext(filename)[0]
+        cached_files = self._read_compiled_cache(key_name)
+        try:
+            data, entry, changed = self._load_data_file(filename, file_path, key_name, cached_files.get(filename))
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Failed to load '{filename}': Invalid JSON syntax - {e}")
+            raise ValueError(f"Room data for level {level_id} could not be loaded.") from e
+
+        if entry is None:
+            error_msg = f"Room data for level {level_id} failed validation. The level cannot start."
+            self.logger.critical(error_msg)
+            raise ValueError(error_msg)
+
+        if changed:
+            self._write_compiled_cache({filename: entry}, key_name)
+        return data
+
+    def release_room_levels(self, keep_level_id) -> List[str]:
+        """Frees every loaded level except keep_level_id. Returns the ids that were released."""
+        rooms = self.master_data.get('rooms')
+        if not isinstance(rooms, LazyLevelRooms):
+            return []
+        released = rooms.release_all_except(keep_level_id)
+        if released:
+            self.logger.info(f"Released room data for finished level(s): {released}")
+        return released
+
+    # --- Compiled master-data cache ---
+
+    def _cache_path(self, stem: str = MASTER_DATA_CACHE_STEM) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"{stem}.cache")
+
+    def _cache_fingerprint(self) -> str:
+        """
+        Identifies everything besides the data files that decides whether cached data is still valid:
+        the cache layout, the interpreter (marshal is version-specific) and the schemas it was validated against.
+        """
+        digest = hashlib.sha1(f"{MASTER_DATA_CACHE_VERSION}|{sys.version_info[:2]}".encode('utf-8'))
+        try:
+            with open(schemas.__file__, 'rb') as f:
+                digest.update(f.read())
+        except (OSError, TypeError):
+            # Frozen builds may not ship schemas.py; fall back to the schema annotations themselves.
+            for name in sorted(self.schema_map):
+                digest.update(f"{name}:{self.schema_map[name].__annotations__}".encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _file_signature(file_path: str) -> Tuple[int, int]:
+        st = os.stat(file_path)
+        return (st.st_size, st.st_mtime_ns)
+
+    def _read_compiled_cache(self, stem: str = MASTER_DATA_CACHE_STEM) -> Dict[str, dict]:
+        """Returns {filename: {'hash', 'signature', 'data'}} from the compiled cache, or {} if unusable."""
+        cache_path = self._cache_path(stem)
+        if not cache_path or not os.path.exists(cache_path):
+            return {}
+        try:
+            with open(cache_path, 'rb') as f:
+                blob = marshal.load(f)
+            if not isinstance(blob, dict) or blob.get('fingerprint') != self._cache_fingerprint():
+                self.logger.info("Compiled data cache is stale; all files will be re-validated.")
+                return {}
+            return blob.get('files', {}) or {}
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable compiled data cache '{cache_path}': {e}")
+            return {}
+
+    def _write_compiled_cache(self, compiled_files: Dict[str, dict], stem: str = MASTER_DATA_CACHE_STEM):
+        cache_path = self._cache_path(stem)
+        if not cache_path:
+            return
+        tmp_path = cache_path + ".tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                marshal.dump({'fingerprint': self._cache_fingerprint(), 'files': compiled_files}, f)
+            os.replace(tmp_path, cache_path)
+            self.logger.info(f"Compiled data cache written to '{cache_path}'.")
+        except Exception as e:
+            self.logger.warning(f"Could not write compiled data cache '{cache_path}': {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
     def _validate_data(self, data: Any, schema: type) -> Tuple[bool, List[str]]:
         """
         Recursively validates data against a TypedDict schema. This is the core enforcement mechanism.
@@ -275,4 +672,110 @@ class ResourceManager:
             self.logger.warning("get_data() called before master data was loaded. Triggering load now.")
             self.load_master_data()
         
-        return self.master_data.get(key, default)
\ No newline at end of file
+        return self.master_data.get(key, default)
+
+    # --- Name indexes ---
+
+    def _build_name_indexes(self):
+        """
+        Inverts items.json once so name lookups no longer scan the catalogue:
+        alias_index maps every normalized key/name/alias to the union of the synonym
+        groups it belongs to, and item_name_index maps a normalized display name to
+        the item keys that carry it.
+        """
+        alias_groups: Dict[str, set] = {}
+        display_names: Dict[str, set] = {}
+        for key, data in (self.master_data.get('items') or {}).items():
+            if not isinstance(data, dict):
+                continue
+            display = data.get('name') or key.replace('_', ' ').capitalize()
+            group = {normalize_name(key), normalize_name(data.get('name', key))}
+            group.update(normalize_name(a) for a in (data.get('aliases') or []))
+            for term in group:
+                alias_groups.setdefault(term, set()).update(group)
+            display_names.setdefault(normalize_name(display), set()).add(key)
+
+        self.alias_index = {term: frozenset(group) for term, group in alias_groups.items()}
+        self.item_name_index = {name: frozenset(keys) for name, keys in display_names.items()}
+        self.logger.info(f"Built name indexes: {len(self.alias_index)} alias terms, {len(self.item_name_index)} item names.")
+
+    def get_synonyms(self, name: str) -> FrozenSet[str]:
+        """Returns the normalized synonym set for a typed name (always contains the name itself)."""
+        norm = normalize_name(name)
+        syns = self.alias_index.get(norm)
+        if syns is None:
+            return frozenset((norm,))
+        return syns
+
+    def get_item_keys_by_name(self, name: str) -> FrozenSet[str]:
+        """Returns the keys of every item whose display name normalizes to the same text as name."""
+        return self.item_name_index.get(normalize_name(name), frozenset())
+
+    # --- Per-level item layout ---
+
+    def get_level_item_layout(self, level_id) -> LevelItemLayout:
+        """
+        One pass over a level's master rooms, remembered until master data is reloaded:
+        which room each statically placed item starts in ('items' and the older
+        'items_present'; the first room listing an item wins) and which rooms hold containers.
+        """
+        level_id = str(level_id)
+        layout = self._level_item_layouts.get(level_id)
+        if layout is not None:
+            return layout
+
+        static_items: Dict[str, str] = {}
+        container_rooms: List[str] = []
+        for room_id, room_data in (self.get_data('rooms', {}).get(level_id) or {}).items():
+            if not isinstance(room_data, dict):
+                continue
+            for listing in (room_data.get('items', []), room_data.get('items_present', [])):
+                for item_key in listing:
+                    if isinstance(item_key, str):
+                        static_items.setdefault(item_key, room_id)
+            if any(isinstance(f, dict) and f.get('is_container') for f in room_data.get('furniture', [])):
+                container_rooms.append(room_id)
+
+        layout = LevelItemLayout(static_items, tuple(container_rooms))
+        self._level_item_layouts[level_id] = layout
+        self.logger.info(f"Indexed level {level_id} items: {len(static_items)} static, {len(container_rooms)} rooms with containers.")
+        return layout
+
+    # --- Omen library ---
+
+    @staticmethod
+    def _collect_omens(omen_library: Dict[str, list], omens_by_trigger: Mapping):
+        for trigger, omen_text in omens_by_trigger.items():
+            if isinstance(omen_text, list):
+                omen_library.setdefault(trigger, []).extend(omen_text)
+            else:
+                omen_library.setdefault(trigger, []).append(omen_text)
+
+    def get_level_omens(self, level_id) -> Mapping:
+        """
+        The level's Omen Library: trigger -> tuple of omen texts, gathered from the
+        'environmental_omens' of every disaster, hazard and NPC plus the level rooms'
+        'environmental_omens_config' blocks. Compiled once per level and read-only.
+        """
+        level_id = str(level_id)
+        library = self._level_omens.get(level_id)
+        if library is not None:
+            return library
+
+        if self._global_omens is None:
+            global_omens: Dict[str, list] = {}
+            for source_name in ('disasters', 'hazards', 'npcs'):
+                for entry in (self.get_data(source_name, {}) or {}).values():
+                    if isinstance(entry, dict) and isinstance(entry.get('environmental_omens'), dict):
+                        self._collect_omens(global_omens, entry['environmental_omens'])
+            self._global_omens = {trigger: tuple(texts) for trigger, texts in global_omens.items()}
+
+        omen_library = {trigger: list(texts) for trigger, texts in self._global_omens.items()}
+        for room_data in (self.get_data('rooms', {}).get(level_id) or {}).values():
+            if isinstance(room_data, dict) and room_data.get('environmental_omens_config'):
+                self._collect_omens(omen_library, room_data['environmental_omens_config'])
+
+        library = MappingProxyType({trigger: tuple(texts) for trigger, texts in omen_library.items()})
+        self._level_omens[level_id] = library
+        self.logger.info(f"Compiled Omen Library for level {level_id} with {len(library)} trigger types.")
+        return library
@@ -779,53 +779,11 @@ class JournalScreen(BaseScreen):
 
     def _check_for_story_completion(self, new_evidence_id):
         """Checks if a newly collected piece of evidence completes a story set."""
-        if not self.resource_manager:
-            logging.warning("ResourceManager not available. Story completion checking disabled.")
-            return
-            
-        evidence_by_source = self.resource_manager.get_data('evidence_by_source', {})
-        if not evidence_by_source:
-            logging.warning("EVIDENCE_BY_SOURCE not found in data. Story completion checking disabled.")
-            return
-
-        collected_ids = set(self.evidence_collection.keys())
-        
-        # Log for debugging
-        logging.info(f"Checking story completion for evidence: {new_evidence_id}")
-        logging.info(f"Current evidence collection: {', '.join(collected_ids)}")
-
-        for source_name, source_data in evidence_by_source.items():
-            # Check if this is the source the new evidence belongs to
-            if new_evidence_id in source_data['evidence_list']:
-                logging.info(f"Evidence {new_evidence_id} belongs to story: {source_name}")
-                
-                required_ids = set(source_data['evidence_list'])
-                # Log for clarity
-                logging.info(f"Required evidence for {source_name}: {', '.join(required_ids)}")
-                logging.info(f"Missing evidence: {', '.join(required_ids - collected_ids)}")
-                
-                # Check if all required IDs for this source are in our collection
-                if required_ids.issubset(collected_ids):
-                    if source_name not in self.unlocked_stories:
-                        self.unlocked_stories.add(source_name)
-                        logging.info(f"Story Unlocked: {source_name}")
-                        
-                        # Trigger notification for story unlock
-                        if self.notify_callback:
-                            self.notify_callback(
-                                "Story Unlocked!",
-                                f"You've collected all evidence for '{source_name}'. Read the full story in your journal."
-                            )
-                        
-                        self.unlock("lore_master")  # Will only unlock on first story
-                        
-                        if len(self.unlocked_stories) >= 5:
-                            self.unlock("historian")
-                        
-                        self._check_story_type_achievements()
-                        
-                        # Always save after unlocking a story
-                        self.save_achievements()
+        if not self.achievements_system:
+            logging.warning("AchievementsSystem not available. Story completion checking disabled.")
+            return []
+        # The Chronicler keeps the evidence -> story index and the per-story counters.
+        return self.achievements_system.check_story_completion(new_evidence_id)
 
     def populate_unlocked_stories_list(self):
         """Populate the stories list with unlocked complete story sets."""
@@ -979,6 +937,9 @@ class JournalScreen(BaseScreen):
         if not app or not app.resource_manager:
             return None
             
+        if self.achievements_system:
+            return self.achievements_system.get_story_progress(evidence_id)
+
         evidence_by_source = app.resource_manager.get_data('evidence_by_source', {})
         if not evidence_by_source:
             return None
@@ -1146,13 +1107,21 @@ class SaveGameScreen(BaseScreen):
     def confirm_save(self, slot_identifier): #
         gs = self.manager.get_screen('game') #
         if gs and gs.game_logic: #
-            save_response = gs.game_logic._command_save(slot_identifier) #
+            save_response = gs.game_logic._command_save(slot_identifier, on_complete=self._on_save_written) #
             self.status_label.text = save_response.get("message", "Save status unknown.") #
-            if save_response.get("success"): #
-                self.populate_save_slots() #
         else: #
             self.status_label.text = color_text("Cannot save: No active game logic.", 'error')
 
+    def _on_save_written(self, success, error):
+        """Called from the save writer thread; hop back onto the Kivy thread before touching widgets."""
+        def _refresh(dt):
+            if success:
+                self.status_label.text = color_text("Game saved.", 'success', self.resource_manager)
+                self.populate_save_slots()
+            else:
+                self.status_label.text = color_text(f"Failed to save game: {error}", 'error', self.resource_manager)
+        Clock.schedule_once(_refresh, 0)
+
     def confirm_delete_popup(self, slot_identifier):
         content = BoxLayout(orientation='vertical', spacing=dp(10), padding=dp(10))
         content.add_widget(Label(text=f"Really delete save slot '{slot_identifier.replace('_',' ').capitalize()}'?\nThis cannot be undone.",
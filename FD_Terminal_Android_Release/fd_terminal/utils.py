@@ -1,8 +1,15 @@
 import re
 from typing import Optional
 import os
+import gzip
 import json
 import logging
+import struct
+import tempfile
+import zlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict
 from .resource_manager import ResourceManager
 # === COLOR CONSTANTS ===
 
@@ -46,6 +53,205 @@ def get_save_filepath(slot_identifier: str = "quicksave") -> str:
     filename = f"savegame_{slot_identifier}.json"
     return os.path.join(save_dir, filename)
 
+# === SAVE FORMAT ===
+# Version 1 saves were pretty-printed JSON holding every room and every hazard's full
+# definition. Version 2 keeps only what differs from master data (room deltas, hazards
+# by type/state) and is written as compact JSON, gzip-compressed when COMPRESS_SAVES is set.
+SAVE_FORMAT_VERSION = 2
+COMPRESS_SAVES = True
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Every save written since then starts with a small header, so slot listings and the
+# startup corruption sweep never have to touch the game state behind it:
+#   magic (4) | header version (u16) | header length (u32) | header JSON | payload
+# The header JSON carries save_info plus the payload's length and CRC-32.
+SAVE_HEADER_MAGIC = b"FDSV"
+SAVE_HEADER_VERSION = 1
+_SAVE_PREFIX = struct.Struct(">4sHI")
+_MAX_HEADER_BYTES = 64 * 1024
+
+def _encode_payload(save_data: dict, compress: bool) -> bytes:
+    raw = json.dumps(save_data, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+    if compress:
+        # mtime=0 keeps identical saves byte-identical
+        return gzip.compress(raw, compresslevel=6, mtime=0)
+    return raw
+
+def encode_save_data(save_data: dict, compress: bool = COMPRESS_SAVES) -> bytes:
+    """Serializes a save dict to the bytes that go on disk, header first."""
+    payload = _encode_payload(save_data, compress)
+    header = json.dumps({
+        "save_version": save_data.get("save_version", SAVE_FORMAT_VERSION),
+        "save_info": save_data.get("save_info", {}),
+        "payload_length": len(payload),
+        "payload_crc32": zlib.crc32(payload),
+    }, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+    return _SAVE_PREFIX.pack(SAVE_HEADER_MAGIC, SAVE_HEADER_VERSION, len(header)) + header + payload
+
+def _parse_save_header(prefix: bytes, header_bytes: bytes) -> dict:
+    magic, version, header_len = _SAVE_PREFIX.unpack(prefix)
+    if version > SAVE_HEADER_VERSION:
+        raise ValueError(f"Save header version {version} is newer than this game supports")
+    if len(header_bytes) != header_len:
+        raise ValueError("Save header is truncated")
+    header = json.loads(header_bytes.decode("utf-8"))
+    if not isinstance(header, dict) or not isinstance(header.get("payload_length"), int):
+        raise ValueError("Save header is malformed")
+    return header
+
+def read_save_header(save_path: str) -> Optional[dict]:
+    """
+    Reads only the header of a save and checks the file is as long as the header says.
+    Returns the header dict ({save_version, save_info, payload_length, payload_crc32}),
+    None for an empty file, and raises ValueError for a damaged one. Legacy saves without
+    a header are fully parsed once and get a header synthesized from their save_info.
+    """
+    with open(save_path, "rb") as f:
+        prefix = f.read(_SAVE_PREFIX.size)
+        if len(prefix) == _SAVE_PREFIX.size and prefix[:4] == SAVE_HEADER_MAGIC:
+            header_len = _SAVE_PREFIX.unpack(prefix)[2]
+            if header_len > _MAX_HEADER_BYTES:
+                raise ValueError("Save header is implausibly large")
+            header = _parse_save_header(prefix, f.read(header_len))
+            expected_size = _SAVE_PREFIX.size + header_len + header["payload_length"]
+            if os.fstat(f.fileno()).st_size != expected_size:
+                raise ValueError("Save file is truncated or has trailing data")
+            return header
+        f.seek(0)
+        save_data = decode_save_data(f.read())
+    if save_data is None:
+        return None
+    if not isinstance(save_data, dict):
+        raise ValueError("Save file is malformed")
+    return {"save_version": save_data.get("save_version", 1), "save_info": save_data.get("save_info", {})}
+
+def decode_save_data(raw: bytes) -> Optional[dict]:
+    """
+    Inverse of encode_save_data. Accepts compressed and plain (including legacy
+    pretty-printed) saves. Returns None for an empty file; raises ValueError
+    (json.JSONDecodeError is one) if the contents can't be read.
+    """
+    if raw[:4] == SAVE_HEADER_MAGIC:
+        if len(raw) < _SAVE_PREFIX.size:
+            raise ValueError("Save header is truncated")
+        header_len = _SAVE_PREFIX.unpack_from(raw)[2]
+        body_start = _SAVE_PREFIX.size + header_len
+        header = _parse_save_header(raw[:_SAVE_PREFIX.size], raw[_SAVE_PREFIX.size:body_start])
+        raw = raw[body_start:]
+        if len(raw) != header["payload_length"] or zlib.crc32(raw) != header.get("payload_crc32"):
+            raise ValueError("Save payload failed its checksum")
+    if raw[:2] == _GZIP_MAGIC:
+        try:
+            raw = gzip.decompress(raw)
+        except (OSError, EOFError) as e:
+            raise ValueError(f"Compressed save is damaged: {e}") from e
+    text = raw.decode("utf-8")
+    if not text.strip():
+        return None
+    return json.loads(text)
+
+def read_save_file(save_path: str) -> Optional[dict]:
+    """Reads and decodes one save file. Same return/raise contract as decode_save_data."""
+    with open(save_path, "rb") as f:
+        return decode_save_data(f.read())
+
+def write_save_file_atomic(save_path: str, payload: bytes):
+    """
+    Writes payload to save_path so that a crash at any point leaves either the old
+    file or the new one, never a truncated save: temp file in the same directory,
+    fsync, then os.replace over the slot.
+    """
+    save_dir = os.path.dirname(save_path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=save_dir, prefix=".savegame_", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, save_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    # Persist the rename itself; not every platform lets us open a directory.
+    try:
+        dir_fd = os.open(save_dir, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except (OSError, AttributeError):
+        pass
+
+class SaveWriter:
+    """
+    The Scribe.
+    Encodes and writes save snapshots on a single background thread, so the game
+    thread never waits on storage. Writes run in submission order; the caller must
+    hand over a snapshot it will not mutate afterwards.
+    """
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+
+    def submit(self, save_path: str, save_data: dict,
+               on_complete: Optional[Callable[[bool, Optional[str]], None]] = None) -> Future:
+        """Queues a write. on_complete(success, error_message) is called from the writer thread."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save_writer")
+            future = self._executor.submit(self._write, save_path, save_data, on_complete)
+            self._pending[save_path] = future
+        future.add_done_callback(lambda f, p=save_path: self._forget(p, f))
+        return future
+
+    def _forget(self, save_path: str, future: Future):
+        with self._lock:
+            if self._pending.get(save_path) is future:
+                del self._pending[save_path]
+
+    def _write(self, save_path: str, save_data: dict, on_complete) -> bool:
+        error = None
+        try:
+            write_save_file_atomic(save_path, encode_save_data(save_data))
+            self.logger.info(f"[_write] Save written to {save_path}")
+        except Exception as e:
+            error = str(e)
+            self.logger.error(f"[_write] Failed to write save {save_path}: {e}", exc_info=True)
+        if on_complete:
+            try:
+                on_complete(error is None, error)
+            except Exception as e:
+                self.logger.error(f"[_write] on_complete callback failed: {e}", exc_info=True)
+        return error is None
+
+    def wait(self, save_path: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """Blocks until the pending write for save_path (or every pending write) is on disk."""
+        with self._lock:
+            if save_path is not None:
+                futures = [self._pending[save_path]] if save_path in self._pending else []
+            else:
+                futures = list(self._pending.values())
+        for future in futures:
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                return False
+        return True
+
+_save_writer: Optional[SaveWriter] = None
+
+def get_save_writer() -> SaveWriter:
+    """The process-wide save writer, shared by every game session."""
+    global _save_writer
+    if _save_writer is None:
+        _save_writer = SaveWriter()
+    return _save_writer
+
 def get_save_slot_info(slot_id: str) -> Optional[dict]:
     """
     Reads the 'save_info' block from a save file for UI previews, without
@@ -62,14 +268,12 @@ def get_save_slot_info(slot_id: str) -> Optional[dict]:
         return None
         
     try:
-        with open(save_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            if not content.strip(): # Handle empty files
-                return None
-            save_data = json.loads(content)
+        header = read_save_header(save_path)
+        if header is None: # Handle empty files
+            return None
 
         # The 'save_info' block is designed specifically for this kind of preview
-        info = save_data.get("save_info", {})
+        info = header.get("save_info", {})
         return {
             "timestamp": info.get("timestamp", "No date"),
             "location": info.get("location", "?"),
@@ -78,7 +282,7 @@ def get_save_slot_info(slot_id: str) -> Optional[dict]:
             "score": info.get("score", 0),
             "corrupted": False
         }
-    except (json.JSONDecodeError, KeyError) as e:
+    except (ValueError, KeyError) as e:
         logging.error(f"Save file for slot '{slot_id}' appears corrupted: {e}")
         # Return a specific structure that the UI can check for
         return {"corrupted": True, "timestamp": "Corrupted File"}
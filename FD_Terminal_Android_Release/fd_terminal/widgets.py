@@ -7,6 +7,9 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.metrics import dp, sp
 from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
 from kivy.uix.popup import Popup
@@ -115,45 +118,96 @@ class StatusDisplayWidget(BoxLayout):
         self.fear_label.text = f"[color={fear_color}]Fear: {fear:.1f}[/color]"
         self.score_label.text = f"[color={score_color}]Score: {score}[/color]"
 
-class OutputPanelWidget(BoxLayout):
-    """A widget for the main game text output area with robust debugging/logging."""
+# How many message blocks the output log keeps before the oldest scroll away for good
+OUTPUT_SCROLLBACK_LIMIT = 300
+
+class OutputLogEntry(RecycleDataViewBehavior, Label):
+    """
+    One message block in the output log. The RecycleView only creates (and textures)
+    these for rows that are on screen, and reuses them as the log scrolls.
+    """
+    index = None
+
     def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.markup = True
+        self.font_name = 'RobotoMono'
+        self.size_hint_y = None
+        self.valign = 'top'
+        self.halign = 'left'
+        self.padding = (dp(8), dp(4))
+        self._rv = None
+        self.bind(width=lambda i, w: setattr(i, 'text_size', (w - dp(12), None)),
+                  texture_size=self._on_texture_size)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.index = index
+        self._rv = rv
+        return super().refresh_view_attrs(rv, index, data)
+
+    def _on_texture_size(self, instance, size):
+        self.height = size[1]
+        # Remember the measured height so the row keeps its size once it scrolls off screen
+        if self._rv is not None and self.index is not None and self.index < len(self._rv.data):
+            self._rv.data[self.index]['height'] = size[1]
+
+class OutputPanelWidget(BoxLayout):
+    """
+    A widget for the main game text output area with robust debugging/logging.
+    Each appended message is its own row in a RecycleView with bounded scrollback,
+    so long sessions don't re-layout one ever-growing label.
+    """
+    def __init__(self, scrollback_limit: int = OUTPUT_SCROLLBACK_LIMIT, **kwargs):
         super().__init__(**kwargs)
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.debug("Initializing OutputPanelWidget")
-        self.output_label = Label(
-            markup=True,
-            font_name='RobotoMono',
-            font_size=scale_sp(12, min_sp=10, max_sp=14),  # REDUCED from body_sp()
-            size_hint_y=None,
-            valign='top',
-            halign='left',
-            padding=(dp(8), dp(8)),
-            text_size=(self.width - dp(12), None)
-        )
-        self.output_label.bind(
-            width=lambda i, w: setattr(i, 'text_size', (w - dp(12), None)),
-            texture_size=lambda i, v: setattr(i, 'height', v[1])
-        )
+        self.scrollback_limit = scrollback_limit
+        self.font_size = scale_sp(12, min_sp=10, max_sp=14)  # REDUCED from body_sp()
+        self.output_scroll_view = RecycleView(size_hint_y=1)
+        self.output_layout = RecycleBoxLayout(orientation='vertical', size_hint_y=None,
+                                              default_size=(None, dp(40)), default_size_hint=(1, None),
+                                              spacing=dp(12), padding=(0, dp(4)))
+        self.output_layout.bind(minimum_height=self.output_layout.setter('height'))
+        self.output_scroll_view.add_widget(self.output_layout)
+        # viewclass is forwarded to the layout manager, so it can only be set once that exists
+        self.output_scroll_view.viewclass = OutputLogEntry
         # Update font size on window resize
-        Window.bind(size=lambda *_: setattr(self.output_label, 'font_size', scale_sp(12, 10, 14)))
-        self.output_scroll_view = ScrollView(size_hint_y=1)
-        self.output_scroll_view.add_widget(self.output_label)
+        Window.bind(size=lambda *_: self._on_font_size_changed(scale_sp(12, 10, 14)))
+        self.output_scroll_view.bind(width=lambda *_: self._forget_row_heights())
         self.add_widget(self.output_scroll_view)
-        self.logger.debug("Output label and scroll view initialized and added")
+        self.logger.debug("Output log and recycle view initialized and added")
 
     def append_text(self, text_to_append, clear_previous=False):
         self.logger.info(f"Appending text: {text_to_append[:60]}{'...' if len(text_to_append) > 60 else ''}")
         processed_text = self._ensure_color_tags_closed(text_to_append)
+        entry = {'text': processed_text, 'font_size': self.font_size}
+        data = self.output_scroll_view.data
         if clear_previous:
             self.logger.debug("Clearing previous text before appending")
-            self.output_label.text = processed_text
+            self.output_scroll_view.data = [entry]
         else:
             self.logger.debug("Appending text to existing output")
-            self.output_label.text += f"\n\n{processed_text}"
+            data.append(entry)
+            overflow = len(data) - self.scrollback_limit
+            if overflow > 0:
+                del data[:overflow]
         Clock.schedule_once(lambda dt: setattr(self.output_scroll_view, 'scroll_y', 0), 0.01)
         self.logger.debug("Scheduled scroll to bottom of output")
 
+    def _forget_row_heights(self):
+        """Wrapped heights depend on width and font size; let visible rows measure themselves again."""
+        for entry in self.output_scroll_view.data:
+            entry.pop('height', None)
+        self.output_scroll_view.refresh_from_data()
+
+    def _on_font_size_changed(self, font_size):
+        if font_size == self.font_size:
+            return
+        self.font_size = font_size
+        for entry in self.output_scroll_view.data:
+            entry['font_size'] = font_size
+        self._forget_row_heights()
+
     def _ensure_color_tags_closed(self, text):
         """Ensure all color tags are properly closed to prevent markup issues."""
         open_tags = text.count('[color=') - text.count('[/color]')
@@ -0,0 +1,361 @@
+# benchmark_turns.py
+"""
+The Stopwatch of Fate.
+
+Headless turn-throughput benchmark for the Die-namic Engine builds. Drives
+GameLogic.process_player_input with a seeded, scripted stream of
+move/examine/take/search/use/force commands on rooms_level_1/2/3 and reports:
+
+- turns/sec and p50/p95/p99 latency for the whole turn
+- the same breakdown for HazardEngine.process_turn, DeathAI.analyze_player_action
+  and GameLogic.get_current_game_state
+- allocations per turn (tracemalloc peak bytes and net allocated blocks),
+  measured in a separate pass so tracing overhead does not skew the timings
+
+Works against both builds:
+
+    python benchmark_turns.py                       # both builds, levels 1-3
+    python benchmark_turns.py --build terminal --levels 1 --turns 2000
+    python benchmark_turns.py --build mall --json results.json
+
+Each build is imported in its own subprocess (both ship an 'fd_terminal'
+package), from a throwaway working directory so saves and achievements written
+during the run never touch the real 'saves' folder.
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import traceback
+
+REPO_ROOT = os.path.abspath(os.path.dirname(__file__))
+BUILDS = {
+    "terminal": os.path.join(REPO_ROOT, "FD_Terminal_Android_Release"),
+    "mall": os.path.join(REPO_ROOT, "FD_Goes_to_..the_Mall!_Android_Release"),
+}
+SECTIONS = ("turn", "hazard_engine.process_turn", "death_ai.analyze_player_action", "get_current_game_state")
+
+# Relative weights of each scripted verb in the command stream.
+COMMAND_WEIGHTS = (
+    ("move", 30),
+    ("examine", 20),
+    ("take", 15),
+    ("search", 15),
+    ("use", 10),
+    ("force", 10),
+)
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+def _summarize(samples):
+    """Collapse a list of per-turn seconds into milliseconds statistics."""
+    values = sorted(samples)
+    total = sum(values)
+    return {
+        "calls": len(values),
+        "total_ms": total * 1000.0,
+        "mean_ms": (total / len(values) * 1000.0) if values else 0.0,
+        "p50_ms": _percentile(values, 50) * 1000.0,
+        "p95_ms": _percentile(values, 95) * 1000.0,
+        "p99_ms": _percentile(values, 99) * 1000.0,
+    }
+
+
+# ==================== SESSION SETUP ====================
+
+def _build_session(character_class, log_level):
+    """Wire the core systems exactly like FinalDestinationApp.create_new_game_session, minus the UI."""
+    import logging
+    from fd_terminal.resource_manager import ResourceManager
+    from fd_terminal.hazard_engine import HazardEngine
+    from fd_terminal.achievements import AchievementsSystem
+    from fd_terminal.game_logic import GameLogic
+    from fd_terminal.death_ai import DeathAI
+    from fd_terminal.qte_engine import QTE_Engine
+
+    # Kivy claims the root logger on import; take it back so log I/O is not what we measure.
+    logging.basicConfig(level=log_level.upper(), handlers=[logging.NullHandler()], force=True)
+
+    resource_manager = ResourceManager()
+    resource_manager.load_master_data()
+    if not character_class:
+        character_class = next(iter(resource_manager.get_data('character_classes', {}) or {"Journalist": {}}))
+
+    hazard_engine = HazardEngine(resource_manager=resource_manager)
+    achievements_system = AchievementsSystem(resource_manager=resource_manager)
+    game_logic = GameLogic(resource_manager=resource_manager)
+    qte_engine = QTE_Engine(resource_manager=resource_manager, game_logic_ref=game_logic)
+    game_logic.qte_engine = qte_engine
+    game_logic.hazard_engine = hazard_engine
+    hazard_engine.game_logic = game_logic
+    game_logic.achievements_system = achievements_system
+    death_ai = DeathAI(game_logic)
+    game_logic.death_ai = death_ai
+    death_ai.hazard_engine = hazard_engine
+    return game_logic, character_class
+
+
+def _instrument(owner, method_name, bucket):
+    """Shadow a bound method with a timing wrapper that appends to bucket."""
+    original = getattr(owner, method_name)
+    perf_counter = time.perf_counter
+
+    def timed(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            bucket.append(perf_counter() - start)
+
+    setattr(owner, method_name, timed)
+    return original
+
+
+# ==================== COMMAND SCRIPT ====================
+
+def _room_targets(game_logic):
+    """Collect the names a player could plausibly type in the current room."""
+    location = game_logic.player.get('location')
+    room = (game_logic.current_level_rooms_world_state or {}).get(location, {}) or {}
+    exits = [d for d, dest in (room.get('exits') or {}).items() if isinstance(dest, str)]
+    furniture = [f.get('name') for f in (room.get('furniture') or []) if isinstance(f, dict) and f.get('name')]
+    objects = []
+    for obj in room.get('objects') or []:
+        if isinstance(obj, dict) and obj.get('name'):
+            objects.append(obj['name'])
+        elif isinstance(obj, str):
+            objects.append(obj.replace('_', ' '))
+    items = [
+        key for key, data in (game_logic.current_level_items_world_state or {}).items()
+        if isinstance(data, dict) and data.get('location') == location
+    ]
+    inventory = list(game_logic.player.get('inventory') or [])
+    return exits, furniture, objects, items, inventory
+
+
+def _next_command(game_logic, rng):
+    exits, furniture, objects, items, inventory = _room_targets(game_logic)
+    verbs = [v for v, _ in COMMAND_WEIGHTS]
+    weights = [w for _, w in COMMAND_WEIGHTS]
+    verb = rng.choices(verbs, weights=weights)[0]
+    scenery = furniture + objects
+
+    if verb == "move" and exits:
+        return f"move {rng.choice(exits)}"
+    if verb == "examine" and (scenery or items):
+        return f"examine {rng.choice(scenery + items)}"
+    if verb == "take" and (items or furniture):
+        return f"take {rng.choice(items)}" if items else "take all"
+    if verb == "search" and furniture:
+        return f"search {rng.choice(furniture)}"
+    if verb == "use" and inventory:
+        item = rng.choice(inventory)
+        return f"use {item} on {rng.choice(scenery)}" if scenery else f"use {item}"
+    if verb == "force" and (exits or scenery):
+        return f"force {rng.choice(exits + scenery)}"
+    return f"move {rng.choice(exits)}" if exits else "look"
+
+
+def _needs_restart(game_logic):
+    return (
+        game_logic.is_game_over
+        or getattr(game_logic, 'game_won', False)
+        or game_logic.player.get('level_complete_flag')
+        or game_logic.player.get('hp', 1) <= 0
+        or game_logic.player.get('turns_left', 1) <= 0
+    )
+
+
+def _clear_qte(game_logic):
+    """QTE timers never tick without a Kivy loop; drop any QTE so the script keeps moving."""
+    qte_engine = game_logic.qte_engine
+    if qte_engine is not None and qte_engine.active_qte:
+        qte_engine._force_qte_cleanup()
+    game_logic.player['qte_active'] = False
+
+
+# ==================== MEASUREMENT ====================
+
+def _run_level(game_logic, character_class, level_id, turns, seed, measure_allocations):
+    rng = random.Random(seed)
+    random.seed(seed)
+    game_logic.start_new_game(character_class=character_class, start_level=level_id)
+
+    buckets = {name: [] for name in SECTIONS}
+    turn_samples = buckets["turn"]
+    per_turn_sections = {name: [] for name in SECTIONS[1:]}
+    restarts = 0
+    alloc_peak_bytes = []
+    alloc_net_blocks = []
+
+    originals = [
+        (game_logic.hazard_engine, "process_turn",
+         _instrument(game_logic.hazard_engine, "process_turn", per_turn_sections["hazard_engine.process_turn"])),
+        (game_logic.death_ai, "analyze_player_action",
+         _instrument(game_logic.death_ai, "analyze_player_action", per_turn_sections["death_ai.analyze_player_action"])),
+        (game_logic, "get_current_game_state",
+         _instrument(game_logic, "get_current_game_state", per_turn_sections["get_current_game_state"])),
+    ]
+    perf_counter = time.perf_counter
+    getallocatedblocks = sys.getallocatedblocks
+    try:
+        for _ in range(turns):
+            if _needs_restart(game_logic):
+                restarts += 1
+                game_logic.start_new_game(character_class=character_class, start_level=level_id)
+            _clear_qte(game_logic)
+            command = _next_command(game_logic, rng)
+            for samples in per_turn_sections.values():
+                samples.clear()
+
+            if measure_allocations:
+                blocks_before = getallocatedblocks()
+                tracemalloc.reset_peak()
+                current_before = tracemalloc.get_traced_memory()[0]
+
+            start = perf_counter()
+            game_logic.process_player_input(command)
+            turn_samples.append(perf_counter() - start)
+
+            if measure_allocations:
+                alloc_peak_bytes.append(max(0, tracemalloc.get_traced_memory()[1] - current_before))
+                alloc_net_blocks.append(getallocatedblocks() - blocks_before)
+
+            for name, samples in per_turn_sections.items():
+                buckets[name].append(sum(samples))
+            game_logic.get_ui_events()
+    finally:
+        for owner, method_name, original in originals:
+            # Drop the instance-level shadow so the class method is visible again.
+            owner.__dict__.pop(method_name, None)
+            if getattr(owner, method_name) != original:
+                setattr(owner, method_name, original)
+
+    return buckets, restarts, alloc_peak_bytes, alloc_net_blocks
+
+
+def run_build(build, levels, turns, seed, character_class, measure_allocations, log_level="CRITICAL"):
+    """Benchmark the fd_terminal package importable from the current sys.path."""
+    game_logic, character_class = _build_session(character_class, log_level)
+    report = {"build": build, "character_class": character_class, "levels": {}}
+
+    for level_id in levels:
+        # Warm-up so first-call caches and imports do not pollute the timings.
+        _run_level(game_logic, character_class, level_id, min(50, turns), seed, False)
+        buckets, restarts, _, _ = _run_level(game_logic, character_class, level_id, turns, seed, False)
+        level_report = {
+            "turns": turns,
+            "restarts": restarts,
+            "turns_per_sec": (turns / sum(buckets["turn"])) if buckets["turn"] else 0.0,
+            "sections": {name: _summarize(samples) for name, samples in buckets.items()},
+        }
+
+        if measure_allocations:
+            tracemalloc.start()
+            try:
+                _, _, peak_bytes, net_blocks = _run_level(game_logic, character_class, level_id, turns, seed, True)
+            finally:
+                tracemalloc.stop()
+            peak_sorted = sorted(peak_bytes)
+            level_report["allocations"] = {
+                "mean_peak_bytes_per_turn": (sum(peak_bytes) / len(peak_bytes)) if peak_bytes else 0.0,
+                "p95_peak_bytes_per_turn": _percentile(peak_sorted, 95),
+                "mean_net_blocks_per_turn": (sum(net_blocks) / len(net_blocks)) if net_blocks else 0.0,
+            }
+        report["levels"][str(level_id)] = level_report
+    return report
+
+
+def print_report(report):
+    print(f"\n=== {report['build']} ({report['character_class']}) ===")
+    for level_id, level in report["levels"].items():
+        print(f"-- rooms_level_{level_id}: {level['turns']} turns, {level['restarts']} restarts, "
+              f"{level['turns_per_sec']:.1f} turns/sec")
+        print(f"   {'section':<34}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}  (ms)")
+        for name, stats in level["sections"].items():
+            print(f"   {name:<34}{stats['mean_ms']:>9.3f}{stats['p50_ms']:>9.3f}"
+                  f"{stats['p95_ms']:>9.3f}{stats['p99_ms']:>9.3f}")
+        allocs = level.get("allocations")
+        if allocs:
+            print(f"   allocations/turn: mean peak {allocs['mean_peak_bytes_per_turn'] / 1024:.1f} KiB, "
+                  f"p95 peak {allocs['p95_peak_bytes_per_turn'] / 1024:.1f} KiB, "
+                  f"net blocks {allocs['mean_net_blocks_per_turn']:.1f}")
+
+
+# ==================== ENTRY POINT ====================
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Headless turn-throughput benchmark for the Die-namic Engine.")
+    parser.add_argument("--build", choices=sorted(BUILDS) + ["all"], default="all")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--turns", type=int, default=500, help="Scripted turns per level.")
+    parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument("--character-class", default=None, help="Defaults to the first class in character_classes.json.")
+    parser.add_argument("--no-allocations", action="store_true", help="Skip the tracemalloc pass.")
+    parser.add_argument("--log-level", default="CRITICAL", help="Root log level while benchmarking.")
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write the raw report(s) to this file.")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def _worker(args):
+    """Runs inside the per-build subprocess; prints a single JSON report on stdout."""
+    sys.path.insert(0, BUILDS[args.build])
+    try:
+        report = run_build(args.build, args.levels, args.turns, args.seed, args.character_class,
+                           not args.no_allocations, args.log_level)
+    except Exception:
+        # Kivy replaces sys.excepthook with its (muted) logger, so print the traceback ourselves.
+        traceback.print_exc()
+        raise SystemExit(1)
+    sys.stdout.write("\n@@REPORT@@" + json.dumps(report) + "\n")
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    if args.worker:
+        _worker(args)
+        return 0
+
+    builds = sorted(BUILDS) if args.build == "all" else [args.build]
+    env = dict(os.environ, KIVY_NO_ARGS="1", KIVY_NO_FILELOG="1")
+    reports = []
+    exit_code = 0
+    for build in builds:
+        cmd = [sys.executable, os.path.abspath(__file__), "--worker", "--build", build,
+               "--levels", *map(str, args.levels), "--turns", str(args.turns), "--seed", str(args.seed),
+               "--log-level", args.log_level]
+        if args.character_class:
+            cmd += ["--character-class", args.character_class]
+        if args.no_allocations:
+            cmd.append("--no-allocations")
+        with tempfile.TemporaryDirectory(prefix=f"fd_bench_{build}_") as scratch:
+            proc = subprocess.run(cmd, cwd=scratch, env=env, capture_output=True, text=True)
+        marker = proc.stdout.rfind("@@REPORT@@")
+        if proc.returncode != 0 or marker < 0:
+            exit_code = 1
+            print(f"\n=== {build} FAILED (exit {proc.returncode}) ===\n{proc.stderr[-4000:]}", file=sys.stderr)
+            continue
+        report = json.loads(proc.stdout[marker + len("@@REPORT@@"):])
+        reports.append(report)
+        print_report(report)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())